@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('vstools')
+
+from vskernels import Bilinear, Box, Gaussian, NoShift, Point  # noqa: E402
+from vskernels.cache import _disk_key, kernel_fingerprint  # noqa: E402
+
+
+def test_private_parameters_are_fingerprinted() -> None:
+    assert kernel_fingerprint(Gaussian(0.5)) != kernel_fingerprint(Gaussian(2.0))
+    assert (Gaussian(0.5).get_axis_weights(8, 16).weights != Gaussian(2.0).get_axis_weights(8, 16).weights).any()
+
+
+def test_wrapper_classes_are_fingerprinted() -> None:
+    kernels = [NoShift[Bilinear](), NoShift[Box](), NoShift[Point]()]
+
+    assert len({kernel_fingerprint(kernel) for kernel in kernels}) == len(kernels)
+    assert len({_disk_key(kernel_fingerprint(kernel)) for kernel in kernels}) == len(kernels)
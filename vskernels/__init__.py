@@ -1,5 +1,8 @@
 # ruff: noqa: F401, F403
 
+from .array import *
+from .bridge import *
+from .cache import *
 from .exceptions import *
 from .kernels import *
 from .types import *
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import re
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from math import ceil
+from os import cpu_count
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterator, NamedTuple, Sequence
+
+from vstools import ChromaLocation
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .kernels import CustomKernel
+
+
+class _Layout(NamedTuple):
+    width: int
+    height: int
+    subsampling: tuple[int, int]
+    n_planes: int
+    bits: int
+
+    @property
+    def dtype(self) -> str:
+        return 'u1' if self.bits <= 8 else '<u2'
+
+    @property
+    def itemsize(self) -> int:
+        return 1 if self.bits <= 8 else 2
+
+    def plane_size(self, plane: int) -> tuple[int, int]:
+        if not plane:
+            return self.width, self.height
+
+        return -(-self.width >> self.subsampling[0]), -(-self.height >> self.subsampling[1])
+
+    @property
+    def frame_size(self) -> int:
+        return sum(w * h for w, h in map(self.plane_size, range(self.n_planes))) * self.itemsize
+
+    def resized(self, width: int, height: int) -> _Layout:
+        return self._replace(width=width, height=height)
+
+
+class _Input(NamedTuple):
+    layout: _Layout
+    offset: int
+    """Offset of the data of the first frame."""
+    stride: int
+    """Bytes between the data of consecutive frames."""
+    n_frames: int
+    chromaloc: ChromaLocation
+    """Location of the chroma samples relative to the luma."""
+    header: bytes
+    """Y4M stream header, empty for raw files."""
+
+
+class _Job(NamedTuple):
+    path: str
+    source: _Input
+    layout: _Layout
+    start: int
+    stop: int
+    shift: tuple[float, float]
+    descale: bool
+
+
+_subsamplings = {'mono': (0, 0), '420': (1, 1), '422': (1, 0), '444': (0, 0)}
+
+_y4m_chromalocs = {
+    '420': ChromaLocation.CENTER, '420jpeg': ChromaLocation.CENTER, '420paldv': ChromaLocation.TOP_LEFT
+}
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    if not (match := re.fullmatch(r'(\d+)x(\d+)', value)):
+        raise ValueError(f'invalid size "{value}", expected WIDTHxHEIGHT')
+
+    return int(match[1]), int(match[2])
+
+
+def _parse_kernel(spec: str) -> CustomKernel:
+    from .kernels import CustomKernel
+
+    if not isinstance(kernel := CustomKernel.from_spec(spec), CustomKernel):
+        raise ValueError(f'the kernel "{spec}" has no array implementation')
+
+    return kernel
+
+
+def _parse_pix_fmt(value: str, width: int, height: int) -> _Layout:
+    if not (match := re.fullmatch(r'(gray|yuv420p|yuv422p|yuv444p)(\d+)?(le)?', value)):
+        raise ValueError(f'unsupported pixel format "{value}"')
+
+    kind, bits = match[1], int(match[2] or 8)
+
+    if kind == 'gray':
+        return _Layout(width, height, (0, 0), 1, bits)
+
+    return _Layout(width, height, _subsamplings[kind[3:6]], 3, bits)
+
+
+def _open_y4m(path: Path) -> _Input:
+    with path.open('rb') as f:
+        header = f.readline()
+        frame_header = f.readline()
+
+    if not header.startswith(b'YUV4MPEG2 '):
+        raise ValueError(f'"{path}" is not a Y4M file')
+
+    if not frame_header.startswith(b'FRAME'):
+        raise ValueError(f'"{path}" has no frames')
+
+    params = {token[:1]: token[1:] for token in header.decode().split()[1:]}
+
+    colorspace = params.get('C', '420jpeg')
+
+    if not (match := re.fullmatch(r'(mono|420|422|444)(\w*?)(?:p(\d+))?', colorspace)):
+        raise ValueError(f'unsupported Y4M colorspace "{colorspace}"')
+
+    if (bits := int(match[3] or (16 if match[1] == 'mono' and match[2] == '16' else 8))) > 16:
+        raise ValueError(f'unsupported Y4M colorspace "{colorspace}"')
+
+    layout = _Layout(
+        int(params['W']), int(params['H']), _subsamplings[match[1]], 1 if match[1] == 'mono' else 3, bits
+    )
+
+    stride = len(frame_header) + layout.frame_size
+    n_frames = (path.stat().st_size - len(header)) // stride
+
+    return _Input(
+        layout, len(header) + len(frame_header), stride, n_frames,
+        _y4m_chromalocs.get(colorspace, ChromaLocation.LEFT), header
+    )
+
+
+def _open_raw(path: Path, layout: _Layout, chromaloc: ChromaLocation) -> _Input:
+    return _Input(layout, 0, layout.frame_size, path.stat().st_size // layout.frame_size, chromaloc, b'')
+
+
+_worker_kernel: CustomKernel | None = None
+
+
+def _init_worker(spec: str) -> None:
+    global _worker_kernel
+
+    _worker_kernel = _parse_kernel(spec)
+
+
+def _process(job: _Job) -> NDArray[Any]:
+    import numpy as np
+
+    from .kernels.abstract import _chroma_shift
+
+    assert _worker_kernel
+
+    source, layout, n = job.source, job.layout, job.stop - job.start
+
+    mapped = np.memmap(job.path, np.uint8, 'r')
+
+    out = np.empty((n, layout.frame_size), np.uint8)
+
+    src_offset = source.offset + job.start * source.stride
+    dst_offset = 0
+
+    for plane in range(layout.n_planes):
+        src_w, src_h = source.layout.plane_size(plane)
+        dst_w, dst_h = layout.plane_size(plane)
+
+        src_planes = np.ndarray(
+            (n, src_h, src_w), layout.dtype, mapped, src_offset,
+            (source.stride, src_w * layout.itemsize, layout.itemsize)
+        )
+        dst_planes = np.ndarray(
+            (n, dst_h, dst_w), layout.dtype, out, dst_offset,
+            (layout.frame_size, dst_w * layout.itemsize, layout.itemsize)
+        )
+
+        subsampling = layout.subsampling if plane else (0, 0)
+
+        if job.descale:
+            shift = _chroma_shift(job.shift, (dst_h / src_h, dst_w / src_w), subsampling, source.chromaloc)
+
+            descaled = _worker_kernel.descale_array(src_planes, dst_w, dst_h, shift)
+
+            np.copyto(dst_planes, np.clip(np.rint(descaled), 0, (1 << layout.bits) - 1), 'unsafe')
+        else:
+            shift = _chroma_shift(job.shift, (src_h / dst_h, src_w / dst_w), subsampling, source.chromaloc)
+
+            _worker_kernel.scale_array(src_planes, dst_w, dst_h, shift, bits=layout.bits, out=dst_planes)
+
+        src_offset += src_w * src_h * layout.itemsize
+        dst_offset += dst_w * dst_h * layout.itemsize
+
+    return out
+
+
+def _jobs(path: Path, source: _Input, layout: _Layout, args: Namespace) -> Iterator[_Job]:
+    chunk = args.chunk or max(1, ceil((64 << 20) / max(source.layout.frame_size, layout.frame_size)))
+
+    for start in range(0, source.n_frames, chunk):
+        yield _Job(
+            str(path), source, layout, start, min(start + chunk, source.n_frames), tuple(args.shift), args.descale
+        )
+
+
+def _write(f: IO[bytes], frames: NDArray[Any], y4m: bool) -> None:
+    if not y4m:
+        f.write(frames)  # type: ignore[arg-type]
+        return
+
+    for frame in frames:
+        f.write(b'FRAME\n')
+        f.write(frame)  # type: ignore[arg-type]
+
+
+def _get_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        'python -m vskernels', description='Scale or descale raw planar and Y4M files with a kernel.'
+    )
+
+    parser.add_argument('input', type=Path, help='Input file, raw planar or Y4M.')
+    parser.add_argument('output', type=Path, help='Output file, written as Y4M if the input is Y4M.')
+    parser.add_argument(
+        '--kernel', '-k', default='bicubic', help='Kernel and its arguments, e.g. "bicubic:b=0,c=0.5".'
+    )
+    parser.add_argument('--size', '-s', type=_parse_size, required=True, help='Output size, as WIDTHxHEIGHT.')
+    parser.add_argument('--descale', '-d', action='store_true', help='Descale instead of scaling.')
+    parser.add_argument(
+        '--shift', type=float, nargs=2, default=(0.0, 0.0), metavar=('TOP', 'LEFT'), help='Shift of the source.'
+    )
+    parser.add_argument(
+        '--input-size', type=_parse_size, help='Size of a raw input, as WIDTHxHEIGHT.'
+    )
+    parser.add_argument(
+        '--pix-fmt', default='yuv420p', help='Pixel format of a raw input, e.g. yuv420p, yuv422p10le, gray16le.'
+    )
+    parser.add_argument(
+        '--chroma-center', action='store_true',
+        help='Chroma of a raw input is centered between the luma samples instead of left-sited.'
+    )
+    parser.add_argument('--workers', '-j', type=int, default=cpu_count(), help='Number of worker processes.')
+    parser.add_argument('--chunk', type=int, help='Frames processed by a worker at once.')
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.input.suffix.lower() == '.y4m':
+            source = _open_y4m(args.input)
+        else:
+            if args.input_size is None:
+                parser.error('--input-size is required for raw inputs')
+
+            source = _open_raw(
+                args.input, _parse_pix_fmt(args.pix_fmt, *args.input_size),
+                ChromaLocation.CENTER if args.chroma_center else ChromaLocation.LEFT
+            )
+
+        _parse_kernel(args.kernel)
+    except (ValueError, KeyError, SyntaxError) as e:
+        parser.error(str(e))
+
+    layout = source.layout.resized(*args.size)
+
+    for size, ss in zip(args.size, layout.subsampling):
+        if size % (1 << ss):
+            parser.error(f'the output size must be a multiple of {1 << ss} with this subsampling')
+
+    header = source.header
+
+    # Y4M doesn't fix the order of the tags, so each size is replaced on its own
+    for tag, value in ((b'W', layout.width), (b'H', layout.height)):
+        header = re.sub(rb'(?<= )' + tag + rb'\d+', tag + str(value).encode(), header)
+
+    workers = args.workers or 1
+
+    with args.output.open('wb') as f, ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(args.kernel, )
+    ) as pool:
+        f.write(header)
+
+        # Only a couple of chunks per worker are in flight, so finished ones can't pile up when writing is slower
+        pending: deque[Future[NDArray[Any]]] = deque()
+
+        for job in _jobs(args.input, source, layout, args):
+            if len(pending) >= workers * 2:
+                _write(f, pending.popleft().result(), bool(header))
+
+            pending.append(pool.submit(_process, job))
+
+        while pending:
+            _write(f, pending.popleft().result(), bool(header))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,594 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import ceil, gcd
+from os import cpu_count
+from threading import local
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from vstools import CustomValueError
+
+from .types import BorderHandling
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+else:
+    NDArray = Any
+
+__all__ = [
+    'AxisWeights',
+
+    'get_axis_weights',
+    'scale_axis',
+    'scale_banded',
+
+    'scale_ewa'
+]
+
+
+class AxisWeights(NamedTuple):
+    """Taps of a one-dimensional resampling, one row per output sample."""
+
+    offsets: NDArray[Any]
+    """Index of the source sample the first tap of every output sample reads. Can be out of bounds."""
+
+    weights: NDArray[Any]
+    """Normalized taps of every output sample, shaped (dst_size, taps)."""
+
+    src_size: int
+    """Size of the source axis."""
+
+    period: int
+    """Number of output samples after which the taps repeat, or 0 if they never do."""
+
+    step: int
+    """Source samples the offsets move forward by every period."""
+
+    edges: tuple[int, int] = (0, 0)
+    """Output samples at the start and end whose taps were folded back inside the axis, outside of the period."""
+
+    @property
+    def dst_size(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def taps(self) -> int:
+        return self.weights.shape[1]
+
+    @property
+    def padding(self) -> tuple[int, int]:
+        """Samples read before the start and after the end of the source axis."""
+
+        return (
+            max(0, -int(self.offsets.min())),
+            max(0, int(self.offsets.max()) + self.taps - self.src_size)
+        )
+
+    def matrix(self) -> NDArray[Any]:
+        """Taps as a dense (dst_size, src_size) matrix, e.g. to solve a descale."""
+
+        import numpy as np
+
+        columns = np.clip(self.offsets[:, None] + np.arange(self.taps)[None, :], 0, self.src_size - 1)
+
+        matrix = np.zeros((self.dst_size, self.src_size))
+        np.add.at(matrix, (np.arange(self.dst_size)[:, None], columns), self.weights)
+
+        return matrix
+
+    def quantize(self, frac_bits: int = 14) -> NDArray[Any]:
+        """
+        Taps as fixed-point integers with ``frac_bits`` fractional bits.
+
+        Every row sums exactly to its rounded float sum, i.e. ``1 << frac_bits`` unless taps were dropped
+        at the edges, the rounding error being added to the largest tap like zimg does.
+        """
+
+        import numpy as np
+
+        scale = 1 << frac_bits
+
+        taps = np.rint(self.weights * scale).astype(np.int64)
+        error = np.rint(self.weights.sum(axis=1) * scale).astype(np.int64) - taps.sum(axis=1)
+
+        taps[np.arange(len(taps)), np.abs(self.weights).argmax(axis=1)] += error
+
+        return taps
+
+
+def _fold_edges(
+    offsets: NDArray[Any], weights: NDArray[Any], src_size: int, border_handling: BorderHandling
+) -> tuple[NDArray[Any], NDArray[Any], tuple[int, int]]:
+    import numpy as np
+
+    taps = weights.shape[1]
+
+    lead = int(np.count_nonzero(offsets < 0))
+    trail = min(int(np.count_nonzero(offsets + taps > src_size)), len(offsets) - lead)
+
+    if not (lead or trail):
+        return offsets, weights, (0, 0)
+
+    rows = np.r_[0:lead, len(offsets) - trail:len(offsets)]
+
+    index = offsets[rows, None] + np.arange(taps)[None, :]
+    folded = weights[rows]
+
+    match border_handling:
+        case BorderHandling.MIRROR:
+            index %= 2 * src_size
+            index = np.where(index >= src_size, 2 * src_size - 1 - index, index)
+        case BorderHandling.ZERO:
+            folded = np.where((index >= 0) & (index < src_size), folded, 0.0)
+            index = np.clip(index, 0, src_size - 1)
+        case BorderHandling.REPEAT:
+            index = np.clip(index, 0, src_size - 1)
+
+    start = np.minimum(index.min(axis=1), max(src_size - taps, 0))
+
+    if (width := int((index - start[:, None]).max()) + 1) > taps:
+        weights = np.pad(weights, ((0, 0), (0, width - taps)))
+
+    edge_weights = np.zeros((len(rows), weights.shape[1]))
+    np.add.at(edge_weights, (np.arange(len(rows))[:, None], index - start[:, None]), folded)
+
+    offsets, weights = offsets.copy(), weights.copy()
+    offsets[rows], weights[rows] = start, edge_weights
+
+    return offsets, weights, (lead, trail)
+
+
+def get_axis_weights(
+    kernel: Callable[..., float], support: float, src_size: int, dst_size: int,
+    shift: float = 0.0, src_window: float | None = None, max_period: int = 64,
+    border_handling: BorderHandling = BorderHandling.MIRROR
+) -> AxisWeights:
+    """
+    Compute the taps for resampling one axis, placing the samples the same way zimg does.
+
+    When the ratio between the sizes is rational with a small period, e.g. every integer scaling factor,
+    only the taps of one period are evaluated and the others are repeated.
+
+    Taps reading outside of the axis are folded back inside it according to the border handling:
+    mirrored ones are added to the sample they reflect to, repeated ones to the edge sample,
+    and zero ones are dropped, so the source isn't padded.
+
+    :param kernel:          Kernel function, called with the keyword argument ``x``.
+    :param support:         Support of the kernel. It is widened by the scaling factor when downscaling.
+    :param src_size:        Size of the source axis.
+    :param dst_size:        Size of the output axis.
+    :param shift:           Position of the source window, in source samples.
+    :param src_window:      Size of the source window. Defaults to the whole axis.
+    :param max_period:      Longest period detected. Longer ones evaluate the kernel for every output sample.
+    :param border_handling: How samples outside of the axis are read.
+
+    :return:                The taps of every output sample.
+    """
+
+    import numpy as np
+
+    src_window = src_size if src_window is None else src_window
+
+    step = src_window / dst_size
+    factor = max(step, 1.0)
+    filter_size = max(ceil(support * factor * 2), 1)
+
+    period, period_step = 0, 0
+
+    if float(src_window).is_integer():
+        div = gcd(int(src_window), dst_size)
+
+        if (period := dst_size // div) <= max_period:
+            period_step = int(src_window) // div
+        else:
+            period = 0
+
+    n_computed = period or dst_size
+
+    pos = (np.arange(n_computed) + 0.5) * step + shift
+    begin_pos = np.floor(pos - filter_size / 2 + 0.5) + 0.5
+
+    x = (begin_pos[:, None] + np.arange(filter_size)[None, :] - pos[:, None]) / factor
+
+    values, inverse = np.unique(x, return_inverse=True)
+    weights = np.array([kernel(x=float(v)) for v in values], np.float64)[inverse].reshape(x.shape)
+
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    offsets = np.floor(begin_pos).astype(np.int64)
+
+    if len(used := np.flatnonzero(weights.any(axis=0))):
+        weights, offsets = weights[:, used[0]:used[-1] + 1], offsets + used[0]
+
+    if period:
+        repeats = ceil(dst_size / period)
+
+        weights = np.tile(weights, (repeats, 1))[:dst_size]
+        offsets = (offsets[None, :] + period_step * np.arange(repeats)[:, None]).reshape(-1)[:dst_size]
+
+    offsets, weights, edges = _fold_edges(offsets, weights, src_size, border_handling)
+
+    return AxisWeights(offsets, weights, src_size, period, period_step, edges)
+
+
+def _gather(
+    src: NDArray[Any], offsets: NDArray[Any], taps: NDArray[Any], out: NDArray[Any] | None = None
+) -> NDArray[Any]:
+    import numpy as np
+
+    out = np.multiply(src[..., offsets], taps[:, 0], out=out)
+
+    for tap in range(1, taps.shape[1]):
+        out += src[..., offsets + tap] * taps[:, tap]
+
+    return out
+
+
+def scale_axis(
+    array: NDArray[Any], weights: AxisWeights, axis: int = -1, bits: int | None = None, frac_bits: int = 14,
+    out: NDArray[Any] | None = None
+) -> NDArray[Any]:
+    """
+    Resample one axis of an array.
+
+    Float arrays keep their type. Integer ones are processed and returned as 32-bit float,
+    unless their bit depth is given: they're then resampled with fixed-point taps, like zimg does,
+    and returned with their type, rounded and clamped to the range of the bit depth.
+    The products are accumulated in 32-bit integers when they can't overflow, in 64-bit ones otherwise.
+
+    Border handling is part of the weights, so the source is only padded when the axis is shorter than the taps.
+
+    Taps that repeat with a period are applied to strided views of the source, one phase at a time,
+    and downscales with equal taps, like Box at an integer factor, become a plain average.
+    Every other case, and the output samples at the edges, gathers the taps of each output sample.
+    Apart from the plain average, the taps are always accumulated in the same order,
+    so the strided and gathering paths give the same result.
+
+    :param array:       Array to resample.
+    :param weights:     Taps computed by :py:func:`get_axis_weights` for this axis.
+    :param axis:        Axis to resample.
+    :param bits:        Bit depth of an integer array, enabling the fixed-point path.
+    :param frac_bits:   Fractional bits of the fixed-point taps.
+    :param out:         Array the result is written to, e.g. a view of a larger output.
+                        When it has the type of the computation, the taps are accumulated in it directly.
+
+    :return:            The resampled array, ``out`` if given.
+    """
+
+    import numpy as np
+
+    fixed = bits is not None and np.issubdtype(array.dtype, np.integer)
+
+    if fixed:
+        taps = weights.quantize(frac_bits)
+
+        bound = ((1 << bits) - 1) * int(np.abs(taps).sum(axis=1).max()) + (1 << frac_bits)
+
+        dtype = np.dtype(np.int32 if bound < 1 << 31 else np.int64)
+        taps = taps.astype(dtype)
+        src = np.moveaxis(np.asarray(array), axis, -1)
+    else:
+        dtype = array.dtype if np.issubdtype(array.dtype, np.floating) else np.dtype(np.float32)
+        taps = weights.weights.astype(dtype)
+        src = np.moveaxis(np.asarray(array, dtype), axis, -1)
+
+    if src.shape[-1] != weights.src_size:
+        raise CustomValueError(
+            'The axis has {size} samples, the weights expect {expected}!', scale_axis,
+            size=src.shape[-1], expected=weights.src_size
+        )
+
+    pad_before, pad_after = weights.padding
+
+    if pad_before or pad_after:
+        src = np.pad(src, [(0, 0)] * (src.ndim - 1) + [(pad_before, pad_after)], 'edge')
+
+    offsets = weights.offsets + pad_before
+
+    lead, trail = weights.edges
+    end = weights.dst_size - trail
+
+    if out is not None and not fixed and out.dtype == dtype:
+        acc = np.moveaxis(out, axis, -1)
+    else:
+        acc = np.empty(src.shape[:-1] + (weights.dst_size, ), dtype)
+
+    if not weights.period or end <= lead:
+        _gather(src, offsets, taps, acc)
+    else:
+        step = weights.step
+
+        for phase in range(lead, min(lead + weights.period, end)):
+            dst = acc[..., phase:end:weights.period]
+            n_out = dst.shape[-1]
+            start = offsets[phase]
+
+            if weights.period == 1 and weights.taps == step and (taps[phase] == taps[phase, 0]).all():
+                window = src[..., start:start + step * n_out].reshape(src.shape[:-1] + (n_out, step))
+                np.multiply(window.sum(-1, dtype=dtype), taps[phase, 0], out=dst)
+                continue
+
+            for tap in range(weights.taps):
+                source = src[..., start + tap:start + tap + step * (n_out - 1) + 1:step]
+
+                if tap:
+                    dst += source * taps[phase, tap]
+                else:
+                    np.multiply(source, taps[phase, tap], out=dst)
+
+        if lead or trail:
+            rows = np.r_[0:lead, end:weights.dst_size]
+            acc[..., rows] = _gather(src, offsets[rows], taps[rows])
+
+    if fixed:
+        acc += 1 << (frac_bits - 1)
+        acc >>= frac_bits
+
+        np.clip(acc, 0, (1 << bits) - 1, out=acc)
+
+    result = np.moveaxis(acc, -1, axis)
+
+    if out is None:
+        return result.astype(array.dtype, copy=False) if fixed else result
+
+    if not np.shares_memory(result, out):
+        np.copyto(out, result, 'unsafe')
+
+    return out
+
+
+def _slice_rows(weights: AxisWeights, start: int, stop: int) -> tuple[AxisWeights, int, int]:
+    offsets = weights.offsets[start:stop]
+
+    first = max(0, int(offsets.min()))
+    last = min(weights.src_size, int(offsets.max()) + weights.taps)
+
+    lead, trail = weights.edges
+
+    lead = min(max(lead - start, 0), stop - start)
+    trail = min(max(stop - (weights.dst_size - trail), 0), stop - start - lead)
+
+    return AxisWeights(
+        offsets - first, weights.weights[start:stop], last - first, weights.period, weights.step, (lead, trail)
+    ), first, last
+
+
+def scale_banded(
+    array: NDArray[Any], horizontal: AxisWeights | None, vertical: AxisWeights | None,
+    out: NDArray[Any] | None = None, max_memory: int | None = None, bits: int | None = None
+) -> NDArray[Any]:
+    """
+    Scale the last two axes of an array, (height, width), in bands of output rows.
+
+    Every band reads the source rows its vertical taps need, i.e. the band plus a halo
+    as wide as the kernel's support, runs the horizontal pass on them and the vertical pass on the result,
+    writing it straight into its rows of the output. Peak memory is then bound by the band size
+    instead of the size of the planes, with long stacks of planes split into groups first.
+
+    :param array:       Array to scale. Leading axes, e.g. planes or frames, are scaled independently.
+    :param horizontal:  Taps of the horizontal pass, or None to leave the width untouched.
+    :param vertical:    Taps of the vertical pass, or None to leave the height untouched.
+    :param out:         Preallocated output. Allocated if not given.
+    :param max_memory:  Approximate memory in bytes the intermediates of a band can take.
+                        Defaults to processing everything as a single band.
+    :param bits:        Bit depth of an integer array, see :py:func:`scale_axis`.
+
+    :return:            The scaled array, ``out`` if given.
+    """
+
+    import numpy as np
+
+    src_h, src_w = array.shape[-2:]
+
+    width = src_w if horizontal is None else horizontal.dst_size
+    height = src_h if vertical is None else vertical.dst_size
+
+    fixed = bits is not None and np.issubdtype(array.dtype, np.integer)
+
+    if fixed:
+        dtype = array.dtype
+    else:
+        dtype = array.dtype if np.issubdtype(array.dtype, np.floating) else np.dtype(np.float32)
+
+    if out is None:
+        out = np.empty(array.shape[:-2] + (height, width), dtype)
+
+    stack = array.reshape((-1, src_h, src_w))
+    out_stack = out.reshape((-1, height, width))
+
+    if not np.shares_memory(out_stack, out):
+        raise CustomValueError('The output must be contiguous over its leading axes!', scale_banded)
+
+    n_planes = len(stack)
+
+    frames, rows = n_planes, height
+
+    if max_memory is not None:
+        itemsize = 8
+        step = src_h / height
+        halo = 0 if vertical is None else vertical.taps
+
+        row_cost = itemsize * (step * (src_w + width) + width)
+        halo_cost = itemsize * halo * (src_w + width)
+
+        if (plane_cost := row_cost * height + halo_cost) <= max_memory:
+            frames = max(1, int(max_memory // plane_cost))
+        else:
+            frames, rows = 1, max(1, int((max_memory - halo_cost) // row_cost))
+
+    for plane in range(0, n_planes, frames):
+        planes = slice(plane, plane + frames)
+
+        for start in range(0, height, rows):
+            stop = min(start + rows, height)
+
+            if vertical is None:
+                band_weights, first, last = None, start, stop
+            else:
+                band_weights, first, last = _slice_rows(vertical, start, stop)
+
+            band = stack[planes, first:last]
+            dst = out_stack[planes, start:stop]
+
+            if horizontal is not None:
+                band = scale_axis(band, horizontal, -1, bits, out=dst if band_weights is None else None)
+
+            if band_weights is not None:
+                scale_axis(band, band_weights, -2, bits, out=dst)
+            elif horizontal is None:
+                dst[...] = band
+
+    return out
+
+
+_worker = local()
+
+
+def _set_worker_pool(name: str) -> None:
+    _worker.pool = name
+
+
+@lru_cache
+def _get_executor(threads: int, name: str) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(threads, f'vskernels-{name}', _set_worker_pool, (name,))
+
+
+def _parallel_map(function: Callable[..., Any], *iterables: Any, threads: int, name: str) -> None:
+    """
+    Call the function over the iterables on the shared pool ``name`` of ``threads`` workers.
+
+    Each call site has its own pool, so a job of one can wait on the other, e.g. the planes of a frame
+    on their bands. A worker calling into its own pool would wait on jobs queued behind it,
+    so it runs them itself instead.
+    """
+
+    if threads > 1 and getattr(_worker, 'pool', None) != name:
+        list(_get_executor(threads, name).map(function, *iterables))
+    else:
+        for args in zip(*iterables):
+            function(*args)
+
+
+def _ewa_axis(
+    src_size: int, dst_size: int, radius: float, shift: float, src_window: float | None
+) -> tuple[NDArray[Any], NDArray[Any], NDArray[Any]]:
+    import numpy as np
+
+    src_window = src_size if src_window is None else src_window
+
+    step = src_window / dst_size
+    factor = max(step, 1.0)
+    taps = ceil(radius * factor * 2) + 1
+
+    pos = (np.arange(dst_size) + 0.5) * step + shift - 0.5
+    begin = np.floor(pos - radius * factor).astype(np.int64) + 1
+
+    distances = (begin[:, None] + np.arange(taps)[None, :] - pos[:, None]) / factor
+
+    return begin, distances, pos
+
+
+def scale_ewa(
+    array: NDArray[Any], width: int, height: int, kernel: Callable[..., float], radius: float,
+    shift: tuple[float, float] = (0, 0), src_width: float | None = None, src_height: float | None = None,
+    antiring: float = 0.0, threads: int | None = None, band_rows: int = 16, lut_size: int = 1024,
+    out: NDArray[Any] | None = None
+) -> NDArray[Any]:
+    """
+    Scale a plane with a polar kernel, as an elliptical weighted average of the samples around every output.
+
+    The kernel is sampled once into a radial lookup table. The distances are computed per axis,
+    and the taps of every combination of vertical and horizontal phase are built once when there are few of them,
+    e.g. at integer scaling factors, and shared by every output sample with the same phases.
+    Rows are processed in bands spread over a thread pool.
+
+    :param array:       Plane to scale, shaped (height, width).
+                        Float arrays keep their type, integer ones are processed and returned as 32-bit float.
+    :param width:       Output width.
+    :param height:      Output height.
+    :param kernel:      Radial kernel function, called with the keyword argument ``x``.
+    :param radius:      Radius of the kernel. It is widened by the scaling factor of each axis when downscaling.
+    :param shift:       Position of the source window as (top, left), in source samples.
+    :param src_width:   Width of the source window.
+    :param src_height:  Height of the source window.
+    :param antiring:    Strength of the clamping of every output to the range of its four nearest samples.
+    :param threads:     Number of threads. Defaults to the number of CPUs.
+    :param band_rows:   Number of output rows processed at once by a thread.
+    :param lut_size:    Number of samples of the radial lookup table.
+    :param out:         Array the result is written to, with the type of the computation.
+
+    :return:            The scaled plane, ``out`` if given.
+    """
+
+    import numpy as np
+
+    dtype = array.dtype if np.issubdtype(array.dtype, np.floating) else np.dtype(np.float32)
+
+    src = np.asarray(array, dtype)
+
+    begin_y, dist_y, pos_y = _ewa_axis(src.shape[0], height, radius, shift[0], src_height)
+    begin_x, dist_x, pos_x = _ewa_axis(src.shape[1], width, radius, shift[1], src_width)
+
+    lut = np.array([kernel(x=radius * i / lut_size) for i in range(lut_size)] + [0.0], np.float64)
+
+    def _weights(dy: NDArray[Any], dx: NDArray[Any]) -> NDArray[Any]:
+        dist = np.sqrt(dy[:, None, :, None] ** 2 + dx[None, :, None, :] ** 2)
+        weights = lut[np.minimum(np.rint(dist * (lut_size / radius)), lut_size).astype(np.intp)]
+
+        return (weights / weights.sum(axis=(2, 3), keepdims=True)).astype(dtype)
+
+    uniq_y, inv_y = np.unique(dist_y, axis=0, return_inverse=True)
+    uniq_x, inv_x = np.unique(dist_x, axis=0, return_inverse=True)
+
+    inv_y, inv_x = inv_y.reshape(-1), inv_x.reshape(-1)
+
+    table = None
+
+    if uniq_y.size * uniq_x.size <= 1 << 22:
+        table = _weights(uniq_y, uniq_x)
+
+    pad_y = (max(0, -int(begin_y.min())), max(0, int(begin_y.max()) + dist_y.shape[1] - src.shape[0]))
+    pad_x = (max(0, -int(begin_x.min())), max(0, int(begin_x.max()) + dist_x.shape[1] - src.shape[1]))
+
+    padded = np.pad(src, (pad_y, pad_x), 'symmetric') if any(pad_y + pad_x) else src
+
+    rows = begin_y[:, None] + pad_y[0] + np.arange(dist_y.shape[1])[None, :]
+    cols = begin_x[:, None] + pad_x[0] + np.arange(dist_x.shape[1])[None, :]
+
+    if out is None:
+        out = np.empty((height, width), dtype)
+
+    if antiring:
+        near_y = np.clip(np.floor(pos_y).astype(np.int64), 0, src.shape[0] - 1)
+        near_x = np.clip(np.floor(pos_x).astype(np.int64), 0, src.shape[1] - 1)
+        next_y = np.minimum(near_y + 1, src.shape[0] - 1)
+        next_x = np.minimum(near_x + 1, src.shape[1] - 1)
+
+    def _band(start: int) -> None:
+        band = slice(start, min(start + band_rows, height))
+
+        if table is None:
+            weights = _weights(dist_y[band], dist_x)
+        else:
+            weights = table[inv_y[band]][:, inv_x]
+
+        samples = padded[rows[band]][:, :, cols]
+
+        out[band] = np.einsum('yaxb,yxab->yx', samples, weights)
+
+        if antiring:
+            corners = np.stack([
+                src[near_y[band]][:, near_x], src[near_y[band]][:, next_x],
+                src[next_y[band]][:, near_x], src[next_y[band]][:, next_x]
+            ])
+
+            clamped = np.clip(out[band], corners.min(axis=0), corners.max(axis=0))
+
+            out[band] += (clamped - out[band]) * antiring
+
+    starts = range(0, height, band_rows)
+
+    _parallel_map(_band, starts, threads=threads or cpu_count() or 1, name='bands')
+
+    return out
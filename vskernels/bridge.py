@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Protocol
+
+from vstools import (
+    DependencyNotFoundError, FuncExceptT, HoldsVideoFormatT, VideoFormatT, core, fallback, get_video_format, vs
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+else:
+    NDArray = Any
+
+__all__ = [
+    'plane_view',
+    'frame_views',
+
+    'ArrayFunction',
+    'array_filter'
+]
+
+
+class ArrayFunction(Protocol):
+    def __call__(self, src: NDArray[Any], dst: NDArray[Any], plane: int) -> None:
+        ...
+
+
+def plane_view(frame: vs.VideoFrame, plane: int, writable: bool = False) -> NDArray[Any]:
+    """
+    Array viewing a plane of a frame through the buffer protocol, without copying it.
+
+    The view follows the stride of the frame, so its rows are usually not contiguous.
+
+    :param frame:       Frame to view.
+    :param plane:       Index of the plane.
+    :param writable:    Whether the view can be written to. Only frames that were just created or copied can be.
+
+    :return:            The plane as a (height, width) array.
+    """
+
+    import numpy as np
+
+    view = np.asarray(frame[plane])
+
+    if not writable and view.flags.writeable:
+        view = view.view()
+        view.flags.writeable = False
+
+    return view
+
+
+def frame_views(frame: vs.VideoFrame, writable: bool = False) -> list[NDArray[Any]]:
+    """Views of every plane of a frame, see :py:func:`plane_view`."""
+
+    return [plane_view(frame, plane, writable) for plane in range(frame.format.num_planes)]
+
+
+def array_filter(
+    clip: vs.VideoNode, function: ArrayFunction, width: int | None = None, height: int | None = None,
+    format: int | VideoFormatT | HoldsVideoFormatT | None = None, threads: int | None = None,
+    func: FuncExceptT | None = None
+) -> vs.VideoNode:
+    """
+    Run a function processing arrays as a filter of the clip.
+
+    For every frame, the function gets a read-only view of each input plane and a writable view
+    of the matching plane of a newly allocated output frame, which it has to fill.
+    No plane is ever copied in or out of an intermediate array.
+
+    The planes of a frame are processed in parallel on a thread pool, on top of the frames
+    VapourSynth already requests in parallel. Frame props are copied from the input.
+
+    :param clip:        Input clip.
+    :param function:    Function called with the source plane, the output plane and the index of the plane.
+    :param width:       Width of the output. Defaults to the width of the input.
+    :param height:      Height of the output. Defaults to the height of the input.
+    :param format:      Format of the output. Defaults to the format of the input.
+    :param threads:     Number of threads processing the planes of a frame.
+                        Defaults to the number of planes, 1 processes them in the calling thread.
+    :param func:        Function returned for custom error handling.
+
+    :return:            The clip produced by the function.
+    """
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        raise DependencyNotFoundError(func or array_filter, 'numpy')
+
+    from .array import _parallel_map
+
+    fmt = get_video_format(clip if format is None else format)
+
+    blank = core.std.BlankClip(
+        clip, fallback(width, clip.width), fallback(height, clip.height), fmt.id, keep=True
+    )
+
+    threads = min(fallback(threads, fmt.num_planes), fmt.num_planes)
+
+    def _process(n: int, f: list[vs.VideoFrame]) -> vs.VideoFrame:
+        fout = f[0].copy()
+        fout.props.update(f[1].props)
+
+        src, dst = frame_views(f[1]), frame_views(fout, True)
+
+        _parallel_map(function, src, dst, range(len(dst)), threads=threads, name='planes')
+
+        return fout
+
+    return blank.std.ModifyFrame([blank, clip], _process)
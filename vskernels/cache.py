@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from ._metadata import __version__
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .array import AxisWeights
+    from .kernels import KernelT
+else:
+    NDArray = Any
+
+__all__ = [
+    'cache_dir',
+    'kernel_fingerprint',
+    'cached_array',
+    'clear_cache',
+
+    'warmup'
+]
+
+_format_version = 1
+
+_scalar_types = (bool, int, float, str, type(None))
+
+_memo: OrderedDict[Any, NDArray[Any]] = OrderedDict()
+_memo_lock = Lock()
+_memo_size = 64 << 20
+_memo_nbytes = 0
+
+_written = -1
+"""Bytes written to the cache since the last eviction, negative until this process first evicted."""
+
+
+def cache_dir() -> Path | None:
+    """
+    Directory of the on-disk cache, or None if it's disabled.
+
+    The cache is opt-in: it's only enabled when ``$VSKERNELS_CACHE_DIR`` is set to a directory.
+    Entries go in a subdirectory per version of the package so tables computed by another version are never read.
+    """
+
+    if not (root := os.environ.get('VSKERNELS_CACHE_DIR')):
+        return None
+
+    return Path(root) / f'{__version__}-{_format_version}'
+
+
+def _max_size() -> int:
+    return int(float(os.environ.get('VSKERNELS_CACHE_SIZE', 256)) * (1 << 20))
+
+
+def kernel_fingerprint(kernel: Any) -> tuple[Any, ...]:
+    """
+    Key identifying what a kernel computes: its class and the scalar values of its parameters and kwargs.
+
+    Private attributes are part of it, as some kernels keep their parameters there, like :py:class:`Gaussian`.
+    Derived state, like lists of coefficients, is left out as it's fully determined by the rest.
+    The class itself is in the key, so kernels with the same parameters but different classes never share tables.
+    """
+
+    params = sorted(
+        (k, v) for k, v in vars(kernel).items()
+        if k != 'kwargs' and isinstance(v, _scalar_types)
+    )
+    kwargs = sorted((k, repr(v)) for k, v in getattr(kernel, 'kwargs', {}).items())
+
+    return (kernel.__class__, tuple(params), tuple(kwargs))
+
+
+def _stable_name(cls: type) -> str | None:
+    # Wrapper classes all share the qualname of their factory's inner class, so they're named by their spec,
+    # and other classes defined in a function can't be told apart from another process at all
+    if '_wrapper_spec' in cls.__dict__:
+        factory, base = cls._wrapper_spec  # type: ignore[attr-defined]
+
+        return None if (inner := _stable_name(base)) is None else f'{factory}[{inner}]'
+
+    if '<locals>' in cls.__qualname__:
+        return None
+
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def _memo_key(key: Any) -> Any:
+    if isinstance(key, (tuple, list)):
+        return tuple(_memo_key(value) for value in key)
+
+    try:
+        hash(key)
+    except TypeError:
+        return repr(key)
+
+    return key
+
+
+def _disk_key(key: Any) -> str | None:
+    if isinstance(key, type):
+        return _stable_name(key)
+
+    if isinstance(key, (tuple, list)):
+        values = list[str]()
+
+        for value in key:
+            if (value := _disk_key(value)) is None:
+                return None
+
+            values.append(value)
+
+        return f'({", ".join(values)}{"," if len(values) == 1 else ""})'
+
+    return repr(key)
+
+
+def _evict(directory: Path, max_size: int) -> None:
+    entries = list[tuple[float, int, Path]]()
+
+    for path in directory.glob('*/*.npy'):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _memoize(key: Any, array: NDArray[Any]) -> NDArray[Any]:
+    global _memo_nbytes
+
+    array.flags.writeable = False
+
+    with _memo_lock:
+        if key not in _memo:
+            _memo[key] = array
+            _memo_nbytes += array.nbytes
+
+        while _memo_nbytes > _memo_size and len(_memo) > 1:
+            _memo_nbytes -= _memo.popitem(False)[1].nbytes
+
+    return array
+
+
+def _load(directory: Path, key: str) -> NDArray[Any] | None:
+    import numpy as np
+
+    digest = sha256(key.encode()).hexdigest()
+    path = directory / digest[:2] / f'{digest}.npy'
+
+    try:
+        array = np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return array
+
+
+def _store(directory: Path, key: str, array: NDArray[Any]) -> None:
+    global _written
+
+    import numpy as np
+
+    digest = sha256(key.encode()).hexdigest()
+    path = directory / digest[:2] / f'{digest}.npy'
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with NamedTemporaryFile('wb', dir=path.parent, suffix='.tmp', delete=False) as f:
+        np.save(f, array)
+
+    os.replace(f.name, path)
+
+    # Eviction scans the whole cache, so it only runs on the first write of a process
+    # and then every time a sixteenth of the size limit has been written
+    max_size = _max_size()
+
+    if _written < 0 or _written + array.nbytes >= max_size // 16:
+        _written = 0
+        _evict(directory, max_size)
+    else:
+        _written += array.nbytes
+
+
+def cached_array(key: Iterable[Any], compute: Callable[[], NDArray[Any]]) -> NDArray[Any]:
+    """
+    Get an array from the cache, computing and storing it on a miss.
+
+    Arrays are memoized in the process, up to 64 MiB of them, so repeated lookups only hash their key.
+    Past that, the opt-in on-disk cache is read, see :py:func:`cache_dir`.
+    Its entries are ``.npy`` files read memory-mapped, so processes using the same table share its pages
+    instead of holding a copy each. Writers go through a temporary file atomically renamed in place,
+    so concurrent processes can compute the same entry and readers never see a partial file.
+    Hits refresh the modification time of the entry, and the least recently used entries are evicted
+    once the cache is over ``$VSKERNELS_CACHE_SIZE`` MiB, 256 by default.
+
+    Any error reading or writing the on-disk cache falls back to the computed array.
+
+    Classes in the key are compared by identity in the process, and by name on disk.
+    Keys with classes that can't be named the same way from another process, like ones defined in a function,
+    are only memoized.
+
+    :param key:         Values identifying the array. They're hashed, or their ``repr`` is when they can't be,
+                        with lists compared as tuples.
+    :param compute:     Function computing the array on a miss.
+
+    :return:            The array, read-only as it's shared by every lookup.
+    """
+
+    key = tuple(key)
+    memo_key = _memo_key(key)
+
+    with _memo_lock:
+        if (array := _memo.get(memo_key)) is not None:
+            _memo.move_to_end(memo_key)
+            return array
+
+    try:
+        directory = cache_dir()
+    except (OSError, RuntimeError, ValueError):
+        directory = None
+
+    disk_key = None if directory is None else _disk_key(key)
+
+    if directory is not None and disk_key is not None and (array := _load(directory, disk_key)) is not None:
+        return _memoize(memo_key, array)
+
+    array = _memoize(memo_key, compute())
+
+    if directory is not None and disk_key is not None:
+        try:
+            _store(directory, disk_key, array)
+        except OSError:
+            pass
+
+    return array
+
+
+def clear_cache() -> None:
+    """Drop the arrays memoized in the process and delete every entry of the on-disk cache of this version."""
+
+    global _memo_nbytes
+
+    with _memo_lock:
+        _memo.clear()
+        _memo_nbytes = 0
+
+    if (directory := cache_dir()) is None:
+        return
+
+    for path in directory.glob('*/*'):
+        path.unlink(missing_ok=True)
+
+
+def _pack_axis_weights(weights: AxisWeights) -> NDArray[Any]:
+    import numpy as np
+
+    header = [weights.src_size, weights.period, weights.step, *weights.edges, weights.dst_size, weights.taps]
+
+    return np.concatenate([np.array(header, np.float64), weights.offsets, weights.weights.reshape(-1)])
+
+
+def _unpack_axis_weights(packed: NDArray[Any]) -> AxisWeights:
+    import numpy as np
+
+    from .array import AxisWeights
+
+    src_size, period, step, lead, trail, dst_size, taps = (int(x) for x in packed[:7])
+
+    offsets = np.asarray(packed[7:7 + dst_size], np.int64)
+    weights = packed[7 + dst_size:].reshape((dst_size, taps))
+
+    return AxisWeights(offsets, weights, src_size, period, step, (lead, trail))
+
+
+def _cached_axis_weights(key: Iterable[Any], compute: Callable[[], AxisWeights]) -> AxisWeights:
+    return _unpack_axis_weights(cached_array(('axis_weights', *key), lambda: _pack_axis_weights(compute())))
+
+
+def warmup(
+    kernels: Iterable[str | KernelT], sizes: Iterable[tuple[int, int]] = (), descale: bool = False
+) -> None:
+    """
+    Compute the tables of kernels ahead of time, e.g. to fill the on-disk cache before starting short-lived workers.
+
+    :param kernels:     Kernels, either objects, classes, or specs as ``"bicubic:b=0,c=0.5"``.
+    :param sizes:       Pairs of (source, output) axis sizes to compute the taps of.
+    :param descale:     Also compute the descale solutions of every pair, from output to source.
+    """
+
+    from .kernels import CustomKernel, Kernel
+
+    sizes = list(sizes)
+
+    for kernel in kernels:
+        kernel = Kernel.from_spec(kernel) if isinstance(kernel, str) else Kernel.ensure_obj(kernel, warmup)
+
+        if not isinstance(kernel, CustomKernel):
+            continue
+
+        for src_size, dst_size in sizes:
+            kernel.get_axis_weights(src_size, dst_size)
+
+            if descale and dst_size > src_size:
+                kernel.get_descale_solution(dst_size, src_size)
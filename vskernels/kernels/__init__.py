@@ -3,6 +3,7 @@
 from .abstract import *
 from .bicubic import *
 from .complex import *
+from .composite import *
 from .custom import *
 from .placebo import *
 from .spline import *
@@ -1,29 +1,36 @@
 from __future__ import annotations
 
+import ast
+import re
+from copy import deepcopy
+from enum import Enum
 from functools import lru_cache
 from inspect import Signature
-from math import ceil
-from typing import Any, Callable, ClassVar, Sequence, TypeVar, Union, cast, overload
+from math import ceil, isfinite
+from typing import Any, Callable, ClassVar, NamedTuple, Sequence, TypeVar, Union, overload
 
 from stgpytools import inject_kwargs_params
 from vstools import (
-    CustomIndexError, CustomRuntimeError, CustomValueError, FieldBased, FuncExceptT, GenericVSFunction,
-    HoldsVideoFormatT, KwargsT, Matrix, MatrixT, T, VideoFormatT, check_correct_subsampling, check_variable_resolution,
-    core, depth, expect_bits, fallback, get_subclasses, get_video_format, inject_self, vs, vs_object
+    ChromaLocation, CustomIndexError, CustomRuntimeError, CustomValueError, FieldBased, FuncExceptT, GenericVSFunction,
+    HoldsVideoFormatT, KwargsT, Matrix, MatrixT, PlanesT, T, VideoFormatT, check_correct_subsampling,
+    check_variable_format, check_variable_resolution, core, expect_bits, fallback, get_subclasses,
+    get_video_format, get_y, inject_self, normalize_planes, vs, vs_object
 )
 from vstools.enums.color import _norm_props_enums
 
 from ..exceptions import UnknownDescalerError, UnknownKernelError, UnknownResamplerError, UnknownScalerError
 from ..types import (
-    BorderHandling, BotFieldLeftShift, BotFieldTopShift, LeftShift, SampleGridModel, TopFieldLeftShift,
-    TopFieldTopShift, TopShift
+    BorderHandling, BotFieldLeftShift, BotFieldTopShift, LeftShift, PrecisionPolicy, SampleGridModel, ScaleQuality,
+    TopFieldLeftShift, TopFieldTopShift, TopShift
 )
 
 __all__ = [
     'Scaler', 'ScalerT',
     'Descaler', 'DescalerT',
     'Resampler', 'ResamplerT',
-    'Kernel', 'KernelT'
+    'Kernel', 'KernelT',
+
+    'RescaleResult'
 ]
 
 _finished_loading_abstract = False
@@ -66,6 +73,222 @@ def _clean_self_kwargs(methods: tuple[Callable[..., Any] | None, ...], self: Any
     return {k: v for k, v in self.kwargs.items() if k not in _get_keywords(methods, self)}
 
 
+_identity_safe_kwargs = frozenset({
+    'border_handling', 'sample_grid_model', 'ignore_mask', 'field_based', 'dither_type',
+    'linear', 'sigmoid', 'luma_only', 'blur', 'taps', 'b', 'c', 'pyramid', 'quality'
+})
+
+
+def _is_identity(
+    clip: vs.VideoNode, width: int, height: int, shift: tuple[TopShift, LeftShift] = (0, 0), **kwargs: Any
+) -> bool:
+    """Whether an operation with these arguments would give back the input clip untouched."""
+
+    if 0 in (clip.width, clip.height) or (width, height) != (clip.width, clip.height) or any(shift):
+        return False
+
+    for key, value in kwargs.items():
+        if key in {'src_top', 'src_left', 'sy', 'sx', 'sar', 'dar', 'dar_in', 'keep_ar'}:
+            same = not value
+        elif key in {'src_width', 'sw'}:
+            same = value == clip.width
+        elif key in {'src_height', 'sh'}:
+            same = value == clip.height
+        elif key == 'format':
+            same = value is None or (clip.format is not None and get_video_format(value) == clip.format)
+        elif key == 'precision':
+            same = clip.format is not None and PrecisionPolicy.from_param(value).get_format(clip) == clip.format
+        elif key == 'planes':
+            same = clip.format is not None and normalize_planes(clip, value) == normalize_planes(clip)
+        else:
+            same = key in _identity_safe_kwargs
+
+        if not same:
+            return False
+
+    return True
+
+
+_source_window_kwargs = frozenset({'src_top', 'src_left', 'src_width', 'src_height', 'sx', 'sy', 'sw', 'sh'})
+
+_shift_safe_kwargs = frozenset({'sample_grid_model', 'ignore_mask', 'field_based', 'dither_type'})
+
+_descale_only_kwargs = frozenset({'ignore_mask'})
+
+_preview_kwargs = frozenset({
+    'src_top', 'src_left', 'src_width', 'src_height', 'sx', 'sy', 'sw', 'sh', 'sar', 'dar', 'dar_in', 'keep_ar',
+    'border_handling', 'sample_grid_model', 'format', 'dither_type'
+})
+"""Arguments kept when scaling with the preview scaler, the kernel specific ones would be misapplied to it."""
+
+
+def _translate(
+    clip: vs.VideoNode, shift: tuple[TopShift, LeftShift], border_handling: BorderHandling
+) -> vs.VideoNode | None:
+    """Whole pixel shift done by cropping and padding, or None if the shift can't be done this way."""
+
+    assert clip.format
+
+    if not all(float(s).is_integer() for s in shift):
+        return None
+
+    top, left = int(shift[0]), int(shift[1])
+
+    if top % (1 << clip.format.subsampling_h) or left % (1 << clip.format.subsampling_w):
+        return None
+
+    if abs(top) >= clip.height or abs(left) >= clip.width:
+        return None
+
+    if top == left == 0:
+        return clip
+
+    cropped = clip.std.Crop(max(left, 0), max(-left, 0), max(top, 0), max(-top, 0))
+
+    return border_handling.pad(cropped, max(-left, 0), max(left, 0), max(-top, 0), max(top, 0))
+
+
+def _plane_shift(
+    clip: vs.VideoNode, plane: int, shift: tuple[TopShift, LeftShift], ratio: tuple[float, float],
+    func: FuncExceptT | None = None
+) -> tuple[TopShift, LeftShift]:
+    """
+    Shift of a plane in its own pixels, matching a shift of the whole clip in luma pixels.
+
+    Subsampled chroma planes are placed by their chroma location, the same way zimg places them.
+
+    :param ratio:   Ratio between the source and output size, as (height, width).
+    """
+
+    assert clip.format
+
+    ss_w, ss_h = (clip.format.subsampling_w, clip.format.subsampling_h) if plane else (0, 0)
+
+    if not (ss_w or ss_h):
+        return shift
+
+    return _chroma_shift(shift, ratio, (ss_w, ss_h), ChromaLocation.from_video(clip, False, func))
+
+
+def _chroma_shift(
+    shift: tuple[TopShift, LeftShift], ratio: tuple[float, float], subsampling: tuple[int, int],
+    chromaloc: ChromaLocation
+) -> tuple[TopShift, LeftShift]:
+    """
+    Shift of a chroma plane in its own pixels, from the shift of the luma and the chroma location.
+
+    :param ratio:       Ratio between the source and output size, as (height, width).
+    :param subsampling: Subsampling of the plane, as (width, height).
+    """
+
+    ss_w, ss_h = subsampling
+
+    offset_w = 0.0 if chromaloc in {
+        ChromaLocation.LEFT, ChromaLocation.TOP_LEFT, ChromaLocation.BOTTOM_LEFT
+    } else ((1 << ss_w) - 1) / 2
+
+    if chromaloc in {ChromaLocation.TOP, ChromaLocation.TOP_LEFT}:
+        offset_h = 0.0
+    elif chromaloc in {ChromaLocation.BOTTOM, ChromaLocation.BOTTOM_LEFT}:
+        offset_h = (1 << ss_h) - 1.0
+    else:
+        offset_h = ((1 << ss_h) - 1) / 2
+
+    return tuple(  # type: ignore[return-value]
+        ((offset + 0.5) * r + s - 0.5 - offset) / (1 << ss) - 0.5 * r + 0.5
+        for offset, r, s, ss in ((offset_h, ratio[0], shift[0], ss_h), (offset_w, ratio[1], shift[1], ss_w))
+    )
+
+
+_spec_wrappers = dict[str, Callable[[Any], type]]()
+"""Factories of wrapper kernel classes, written as ``name[kernel]`` in specs."""
+
+
+def _spec_class(text: str) -> type[BaseScaler]:
+    if not (match := re.fullmatch(r'\s*(\w+)\s*(?:\[(.+)\])?\s*', text)):
+        raise UnknownKernelError(BaseScaler.from_spec, text)
+
+    name, inner = match[1].lower(), match[2]
+
+    if inner is not None:
+        if name not in _spec_wrappers:
+            raise UnknownKernelError(BaseScaler.from_spec, text)
+
+        return _spec_wrappers[name](_spec_class(inner))
+
+    for scaler_cls in get_subclasses(BaseScaler):  # type: ignore[type-abstract]
+        if scaler_cls.__name__.lower() == name and '_wrapper_spec' not in scaler_cls.__dict__:
+            return scaler_cls
+
+    raise UnknownKernelError(BaseScaler.from_spec, text)
+
+
+def _spec_eval(node: ast.expr) -> Any:
+    # Non-finite floats are written as float('inf'), float('-inf') and float('nan')
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'float':
+        return float(*(ast.literal_eval(arg) for arg in node.args))
+
+    if isinstance(node, ast.Call):
+        return _spec_class(ast.unparse(node.func))(
+            *(_spec_eval(arg) for arg in node.args),
+            **{str(kw.arg): _spec_eval(kw.value) for kw in node.keywords}
+        )
+
+    if isinstance(node, ast.Subscript):
+        return _spec_class(ast.unparse(node))
+
+    if isinstance(node, ast.Name):
+        try:
+            return _spec_class(node.id)
+        except UnknownKernelError:
+            return node.id
+
+    if isinstance(node, (ast.Tuple, ast.List)):
+        values = [_spec_eval(elt) for elt in node.elts]
+        return tuple(values) if isinstance(node, ast.Tuple) else values
+
+    if isinstance(node, ast.Dict):
+        return {_spec_eval(k): _spec_eval(v) for k, v in zip(node.keys, node.values) if k is not None}
+
+    return ast.literal_eval(node)
+
+
+def _spec_name(cls: type) -> str:
+    if '_wrapper_spec' in cls.__dict__:
+        factory, base = cls._wrapper_spec  # type: ignore[attr-defined]
+        return f'{factory}[{_spec_name(base)}]'
+
+    return cls.__name__
+
+
+def _spec_value(value: Any) -> str:
+    if isinstance(value, BaseScaler):
+        return f'{_spec_name(value.__class__)}({value._spec_args()})'
+
+    if isinstance(value, type) and issubclass(value, BaseScaler):
+        return _spec_name(value)
+
+    if isinstance(value, Enum):
+        return _spec_value(value.value)
+
+    if isinstance(value, tuple):
+        return f'({", ".join(map(_spec_value, value))}{"," if len(value) == 1 else ""})'
+
+    if isinstance(value, list):
+        return f'[{", ".join(map(_spec_value, value))}]'
+
+    if isinstance(value, dict):
+        return '{' + ', '.join(f'{_spec_value(k)}: {_spec_value(v)}' for k, v in value.items()) + '}'
+
+    if isinstance(value, float) and not isfinite(value):
+        return f"float('{value}')"
+
+    if isinstance(value, (bool, int, float, str, type(None))):
+        return repr(value)
+
+    raise CustomValueError('"{value}" can\'t be written in a kernel spec!', BaseScaler.to_spec, value=value)
+
+
 def _base_from_param(
     cls: type[T],
     basecls: type[T],
@@ -130,9 +353,71 @@ class BaseScaler(vs_object):
 
     _err_class: ClassVar[type[CustomValueError]]
 
+    _init_args: tuple[tuple[Any, ...], KwargsT]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> BaseScaler:
+        self = super().__new__(cls, *args, **kwargs)
+        self._init_args = (args, kwargs)
+        return self
+
     def __init__(self, **kwargs: Any) -> None:
         self.kwargs = kwargs
 
+    def __reduce__(self) -> str | tuple[Any, ...]:
+        try:
+            return (BaseScaler.from_spec, (self.to_spec(), ))
+        except CustomValueError:
+            return super().__reduce__()
+
+    # Copies go through __reduce_ex__ as well, they copy the state instead of rebuilding from the spec
+    def __copy__(self) -> BaseScaler:
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        return new
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> BaseScaler:
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.__dict__.update(deepcopy(self.__dict__, memo))
+        return new
+
+    def _spec_args(self) -> str:
+        args, kwargs = self._init_args
+
+        return ','.join([*map(_spec_value, args), *(f'{k}={_spec_value(v)}' for k, v in kwargs.items())])
+
+    def to_spec(self) -> str:
+        """
+        Compact string this kernel can be rebuilt from with :py:attr:`from_spec`, e.g. ``Bicubic:b=0,c=0.5``.
+
+        It holds the class and the arguments the kernel was created with. Wrapper classes, like the ones
+        made by :py:attr:`NoShift.from_kernel`, are written as ``NoShift[Lanczos]``,
+        and kernels passed as arguments as ``Catrom()``. It's also how kernels are pickled.
+        """
+
+        return _spec_name(self.__class__) + (f':{args}' if (args := self._spec_args()) else '')
+
+    @staticmethod
+    def from_spec(spec: str) -> BaseScaler:
+        """
+        Build a kernel from a spec written by :py:attr:`to_spec`, or by hand, e.g. ``bicubic:b=0,c=0.5``.
+
+        Names are case insensitive. Arguments are Python literals, kernels or kernel classes,
+        and bare words that aren't kernel names are read as strings.
+        Strings that are also kernel names have to be quoted, as :py:attr:`to_spec` always does.
+        """
+
+        name, _, args = spec.partition(':')
+
+        call = ast.parse(f'_({args})', mode='eval').body
+
+        assert isinstance(call, ast.Call)
+
+        return _spec_class(name)(
+            *(_spec_eval(arg) for arg in call.args),
+            **{str(kw.arg): _spec_eval(kw.value) for kw in call.keywords}
+        )
+
     def __init_subclass__(cls) -> None:
         if not _finished_loading_abstract:
             return
@@ -216,6 +501,23 @@ class BaseScaler(vs_object):
 BaseScalerT = TypeVar('BaseScalerT', bound=BaseScaler)
 
 
+class RescaleResult(NamedTuple):
+    """Outputs of :py:attr:`Kernel.rescale`."""
+
+    descaled: vs.VideoNode
+    """The descaled clip."""
+
+    rescaled: vs.VideoNode
+    """The descaled clip scaled back to the input resolution."""
+
+    error: vs.VideoNode
+    """
+    Absolute difference between the input and the rescaled clip, in 32-bit float.
+
+    Its ``RescaleError`` statistics props only measure the first plane, the luma of YUV clips.
+    """
+
+
 class Scaler(BaseScaler):
     """
     Abstract scaling interface.
@@ -230,12 +532,89 @@ class Scaler(BaseScaler):
     @inject_kwargs_params
     def scale(
         self, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
-        shift: tuple[TopShift, LeftShift] = (0, 0), **kwargs: Any
+        shift: tuple[TopShift, LeftShift] = (0, 0), *,
+        pyramid: bool = False, quality: ScaleQuality = ScaleQuality.FULL, **kwargs: Any
     ) -> vs.VideoNode:
+        """
+        Scale a clip to the given resolution.
+
+        :param clip:        Input clip
+        :param width:       Output width
+        :param height:      Output height
+        :param shift:       Shift clip during the operation.
+                            Expects a tuple of (src_top, src_left).
+        :param pyramid:     Reduce large downscales with exact 2x Box steps until the remaining factor
+                            is at most 2, then scale with this kernel.
+                            Compared to a single pass, the steps attenuate the output by at most
+                            ~10% at half the output Nyquist frequency and ~36% at the output Nyquist frequency.
+                            Aliasing of the steps lands above the output Nyquist frequency,
+                            where the final pass removes it.
+        :param quality:     Scale with :py:attr:`preview_scaler` and the pyramid when set to preview.
+                            Only the geometry and border arguments are passed to the preview scaler.
+        """
+
         width, height = Scaler._wh_norm(clip, width, height)
+
+        if _is_identity(clip, width, height, shift, **kwargs):
+            return clip
+
         check_correct_subsampling(clip, width, height)
+
+        if ScaleQuality.from_param(quality, self.scale) is ScaleQuality.PREVIEW:
+            if (preview := self.preview_scaler) is not self:
+                return preview.scale(
+                    clip, width, height, shift, pyramid=True,
+                    **{k: v for k, v in kwargs.items() if k in _preview_kwargs}
+                )
+
+            pyramid = True
+
+        if pyramid:
+            clip, shift, kwargs = self._pyramid_reduce(clip, width, height, shift, **kwargs)
+
         return self.scale_function(clip, **_norm_props_enums(self.get_scale_args(clip, shift, width, height, **kwargs)))
 
+    @inject_self.cached.property
+    def preview_scaler(self) -> Scaler:
+        """Cheaper scaler of similar character, used when scaling with ``quality=ScaleQuality.PREVIEW``."""
+
+        from .bicubic import Catrom, Mitchell
+
+        if self.kernel_radius <= 2:
+            return self
+
+        return Catrom() if getattr(self, 'is_interpolating', True) else Mitchell()
+
+    def _pyramid_reduce(
+        self, clip: vs.VideoNode, width: int, height: int, shift: tuple[TopShift, LeftShift], **kwargs: Any
+    ) -> tuple[vs.VideoNode, tuple[TopShift, LeftShift], KwargsT]:
+        from .various import Box
+
+        assert clip.format
+
+        src_width = kwargs.get('src_width', clip.width)
+        src_height = kwargs.get('src_height', clip.height)
+
+        while True:
+            half_w = src_width > width * 2 and not clip.width % (2 << clip.format.subsampling_w)
+            half_h = src_height > height * 2 and not clip.height % (2 << clip.format.subsampling_h)
+
+            if not (half_w or half_h):
+                break
+
+            clip = Box.scale(clip, clip.width // (1 + half_w), clip.height // (1 + half_h))
+
+            shift = (shift[0] / (1 + half_h), shift[1] / (1 + half_w))
+            src_width, src_height = src_width / (1 + half_w), src_height / (1 + half_h)
+
+        if 'src_width' in kwargs or src_width != clip.width:
+            kwargs['src_width'] = src_width
+
+        if 'src_height' in kwargs or src_height != clip.height:
+            kwargs['src_height'] = src_height
+
+        return clip, shift, kwargs
+
     @inject_self.cached
     def multi(
         self, clip: vs.VideoNode, multi: float = 2, shift: tuple[TopShift, LeftShift] = (0, 0), **kwargs: Any
@@ -251,6 +630,52 @@ class Scaler(BaseScaler):
 
         return self.scale(clip, dst_width, dst_height, shift, **kwargs)
 
+    @inject_self.cached
+    def scale_ladder(
+        self, clip: vs.VideoNode, sizes: Sequence[tuple[int, int]], shift: tuple[TopShift, LeftShift] = (0, 0),
+        cascade_ratio: float | None = 2.0, **kwargs: Any
+    ) -> list[vs.VideoNode]:
+        """
+        Scale a clip to several resolutions at once, e.g. for an ABR ladder.
+
+        Every rung is scaled from the smallest rung already done that is at least ``cascade_ratio`` times
+        larger on both axes, and from the input otherwise, so the full resolution frames are read fewer times.
+        The cascaded rungs keep the same sample positions as scaling from the input;
+        the only difference is the intermediate's filtering, which with a ratio of 2 or more
+        lies above the rung's Nyquist frequency.
+
+        :param clip:            Input clip
+        :param sizes:           (width, height) of every rung.
+        :param shift:           Shift clip during the operation.
+                                Expects a tuple of (src_top, src_left).
+                                The shift and source window are only given to rungs scaled from the input,
+                                the cascaded ones inherit them.
+        :param cascade_ratio:   Minimum size ratio between a rung and the rung it is scaled from.
+                                None or 0 scales every rung from the input.
+
+        :return:                The scaled clips, in the same order as ``sizes``.
+        """
+
+        assert check_variable_resolution(clip, self.scale_ladder)
+
+        cascade_kwargs = {k: v for k, v in kwargs.items() if k not in _source_window_kwargs}
+
+        scaled = dict[tuple[int, int], vs.VideoNode]()
+
+        for width, height in sorted(set(sizes), key=lambda size: size[0] * size[1], reverse=True):
+            sources = [
+                (w, h) for w, h in scaled
+                if cascade_ratio and w >= width * cascade_ratio and h >= height * cascade_ratio
+            ]
+
+            if sources:
+                source = min(sources, key=lambda size: size[0] * size[1])
+                scaled[(width, height)] = self.scale(scaled[source], width, height, **cascade_kwargs)
+            else:
+                scaled[(width, height)] = self.scale(clip, width, height, shift, **kwargs)
+
+        return [scaled[size] for size in sizes]
+
     @inject_kwargs_params
     def get_scale_args(
         self, clip: vs.VideoNode, shift: tuple[TopShift, LeftShift] = (0, 0),
@@ -268,7 +693,7 @@ class Scaler(BaseScaler):
         )
 
     def get_implemented_funcs(self) -> tuple[Callable[..., Any], ...]:
-        return (self.scale, self.multi)
+        return (self.scale, self.multi, self.scale_ladder)
 
 
 class Descaler(BaseScaler):
@@ -292,20 +717,41 @@ class Descaler(BaseScaler):
         border_handling: BorderHandling = BorderHandling.MIRROR,
         sample_grid_model: SampleGridModel = SampleGridModel.MATCH_EDGES,
         field_based: FieldBased | None = None,
+        planes: PlanesT = None,
+        precision: PrecisionPolicy = PrecisionPolicy.ORIGINAL,
         **kwargs: Any
     ) -> vs.VideoNode:
         width, height = self._wh_norm(clip, width, height)
 
+        if planes is not None:
+            assert check_variable_format(clip, self.descale)
+
+            if (planes := normalize_planes(clip, planes)) != normalize_planes(clip):
+                if planes != [0]:
+                    raise CustomValueError(
+                        'You can only descale either all the planes or the luma alone!', self.descale, planes
+                    )
+
+                clip = get_y(clip)
+
         check_correct_subsampling(clip, width, height)
 
         field_based = FieldBased.from_param_or_video(field_based, clip)
 
+        if not field_based.is_inter and not any(isinstance(sh, tuple) for sh in shift) and _is_identity(
+            clip, width, height, shift, precision=precision, **kwargs  # type: ignore[arg-type]
+        ):
+            return clip
+
         clip, bits = expect_bits(clip, 32)
 
         de_base_args = (width, height // (1 + field_based.is_inter))
         kwargs |= dict(border_handling=BorderHandling.from_param(border_handling, self.descale))
 
         if field_based.is_inter:
+            if height % 2:
+                raise CustomIndexError('You can\'t descale to odd resolution when crossconverted!', self.descale)
+
             shift_y, shift_x = tuple[tuple[float, float], ...](
                 sh if isinstance(sh, tuple) else (sh, sh) for sh in shift
             )
@@ -316,21 +762,9 @@ class Descaler(BaseScaler):
             de_kwargs_tf = self.get_descale_args(clip, (shift_y[0], shift_x[0]), *de_base_args, **kwargs_tf)
             de_kwargs_bf = self.get_descale_args(clip, (shift_y[1], shift_x[1]), *de_base_args, **kwargs_bf)
 
-            if height % 2:
-                raise CustomIndexError('You can\'t descale to odd resolution when crossconverted!', self.descale)
-
-            field_shift = 0.125 * height / clip.height
-
-            fields = clip.std.SeparateFields(field_based.is_tff)
-
-            interleaved = core.std.Interleave([
-                self.descale_function(fields[offset::2], **_norm_props_enums(
-                    de_kwargs | dict(src_top=de_kwargs.get('src_top', 0.0) + (field_shift * mult))
-                ))
-                for offset, mult, de_kwargs in [(0, 1, de_kwargs_tf), (1, -1, de_kwargs_bf)]
-            ])
-
-            descaled = interleaved.std.DoubleWeave(field_based.is_tff)[::2]
+            descaled = self._descale_fields(
+                clip, field_based.is_tff, (de_kwargs_tf, de_kwargs_bf), 0.125 * height / clip.height
+            )
         else:
             if any(isinstance(sh, tuple) for sh in shift):
                 raise CustomValueError('You can\'t descale per-field when the input is progressive!', self.descale)
@@ -341,7 +775,23 @@ class Descaler(BaseScaler):
 
             descaled = self.descale_function(clip, **_norm_props_enums(de_kwargs))
 
-        return depth(descaled, bits)
+        return PrecisionPolicy.from_param(precision, self.descale).apply(descaled, bits)
+
+    def _descale_fields(
+        self, clip: vs.VideoNode, tff: bool, fields_kwargs: tuple[KwargsT, KwargsT], field_shift: float
+    ) -> vs.VideoNode:
+        fields = clip.std.SeparateFields(tff)
+
+        # Each field's descale runs on the whole separated clip and only the matching frames get picked,
+        # so the fields don't have to be split in two clips beforehand.
+        descaled = core.std.Interleave([
+            self.descale_function(fields, **_norm_props_enums(
+                de_kwargs | dict(src_top=de_kwargs.get('src_top', 0.0) + (field_shift * mult))
+            ))
+            for mult, de_kwargs in zip((1, -1), fields_kwargs)
+        ]).std.SelectEvery(4, [0, 3])
+
+        return descaled.std.DoubleWeave(tff)[::2]
 
     @inject_kwargs_params
     def get_descale_args(
@@ -379,6 +829,13 @@ class Resampler(BaseScaler):
         self, clip: vs.VideoNode, format: int | VideoFormatT | HoldsVideoFormatT,
         matrix: MatrixT | None = None, matrix_in: MatrixT | None = None, **kwargs: Any
     ) -> vs.VideoNode:
+        same_matrix = matrix is None or (
+            matrix_in is not None and Matrix.from_param(matrix) == Matrix.from_param(matrix_in)
+        )
+
+        if same_matrix and clip.format == get_video_format(format) and kwargs.keys() <= _identity_safe_kwargs:
+            return clip
+
         return self.resample_function(
             clip, **_norm_props_enums(self.get_resample_args(clip, format, matrix, matrix_in, **kwargs))
         )
@@ -409,10 +866,19 @@ class Kernel(Scaler, Descaler, Resampler):
 
     _err_class = UnknownKernelError  # type: ignore
 
+    @inject_self.cached.property
+    def is_interpolating(self) -> bool:
+        """Whether the kernel passes through every source sample, so whole pixel shifts are a pure translation."""
+
+        return False
+
     @overload
     @inject_self.cached
     @inject_kwargs_params
-    def shift(self, clip: vs.VideoNode, shift: tuple[TopShift, LeftShift] = (0, 0), **kwargs: Any) -> vs.VideoNode:
+    def shift(
+        self, clip: vs.VideoNode, shift: tuple[TopShift, LeftShift] = (0, 0),
+        *, border_handling: BorderHandling = BorderHandling.MIRROR, **kwargs: Any
+    ) -> vs.VideoNode:
         ...
 
     @overload
@@ -420,7 +886,8 @@ class Kernel(Scaler, Descaler, Resampler):
     @inject_kwargs_params
     def shift(
         self, clip: vs.VideoNode,
-        shift_top: float | list[float] = 0.0, shift_left: float | list[float] = 0.0, **kwargs: Any
+        shift_top: float | list[float] = 0.0, shift_left: float | list[float] = 0.0,
+        *, border_handling: BorderHandling = BorderHandling.MIRROR, **kwargs: Any
     ) -> vs.VideoNode:
         ...
 
@@ -429,14 +896,16 @@ class Kernel(Scaler, Descaler, Resampler):
     def shift(
         self, clip: vs.VideoNode,
         shifts_or_top: float | tuple[float, float] | list[float] | None = None,
-        shift_left: float | list[float] | None = None, **kwargs: Any
+        shift_left: float | list[float] | None = None,
+        *, border_handling: BorderHandling = BorderHandling.MIRROR, **kwargs: Any
     ) -> vs.VideoNode:
         assert clip.format
 
         n_planes = clip.format.num_planes
+        border_handling = BorderHandling.from_param(border_handling, self.shift)
 
         def _shift(src: vs.VideoNode, shift: tuple[TopShift, LeftShift] = (0, 0)) -> vs.VideoNode:
-            return Scaler.scale(self, src, src.width, src.height, shift, **kwargs)
+            return self._shift_clip(src, shift, border_handling, **kwargs)
 
         if not shifts_or_top and not shift_left:
             return _shift(clip)
@@ -470,14 +939,235 @@ class Kernel(Scaler, Descaler, Resampler):
         if len(set(shifts_top)) == len(set(shifts_left)) == 1 or n_planes == 1:
             return _shift(clip, (shifts_top[0], shifts_left[0]))
 
-        planes = cast(list[vs.VideoNode], clip.std.SplitPlanes())
+        plane_shifts = list(zip(shifts_top, shifts_left))
+
+        if kwargs.keys() <= _shift_safe_kwargs:
+            if (convolved := self._convolve_shift(clip, plane_shifts, border_handling)) is not None:
+                return convolved
+
+        groups = dict[tuple[TopShift, LeftShift], list[int]]()
+
+        for plane, (top, left) in enumerate(plane_shifts):
+            if plane:
+                top, left = top * (1 << clip.format.subsampling_h), left * (1 << clip.format.subsampling_w)
+
+            groups.setdefault((top, left), []).append(plane)
+
+        # The shift shared by the most planes resizes the whole clip, as resize places every plane from one shift,
+        # and only the planes with another shift are split out and resized alone
+        main_shift, main_planes = max(groups.items(), key=lambda group: (len(group[1]), not any(group[0])))
+
+        if len(groups) == 1:
+            return _shift(clip, main_shift)
+
+        main = _shift(clip, main_shift)
+
+        shifted = [(main if plane in main_planes else clip, plane) for plane in range(n_planes)]
+
+        for shift, planes in groups.items():
+            if planes is main_planes or not any(shift):
+                continue
+
+            for plane in planes:
+                shifted[plane] = (_shift(clip.std.ShufflePlanes(plane, vs.GRAY), plane_shifts[plane]), 0)
+
+        clips, planes = zip(*shifted)
+
+        return core.std.ShufflePlanes(list(clips), list(planes), clip.format.color_family)
+
+    def _shift_clip(
+        self, clip: vs.VideoNode, shift: tuple[TopShift, LeftShift],
+        border_handling: BorderHandling, **kwargs: Any
+    ) -> vs.VideoNode:
+        if _is_identity(clip, clip.width, clip.height, shift, **kwargs):
+            return clip
+
+        if kwargs.keys() <= _shift_safe_kwargs:
+            if self.is_interpolating and (translated := _translate(clip, shift, border_handling)) is not None:
+                return translated
+
+            plane_shifts = [
+                (shift[0] / (1 << clip.format.subsampling_h), shift[1] / (1 << clip.format.subsampling_w))
+                if plane else shift for plane in range(clip.format.num_planes)
+            ]
+
+            if (convolved := self._convolve_shift(clip, plane_shifts, border_handling)) is not None:
+                return convolved
+
+        padded = border_handling.prepare_clip(clip, self.kernel_radius, bool(shift[1]), bool(shift[0]))
+
+        if padded is not clip:
+            shift = (
+                shift[0] + (padded.height - clip.height) // 2,
+                shift[1] + (padded.width - clip.width) // 2
+            )
+            kwargs.update(src_width=clip.width, src_height=clip.height)
+
+        return Scaler.scale(self, padded, clip.width, clip.height, shift, **kwargs)
+
+    def _convolve_shift(
+        self, clip: vs.VideoNode, plane_shifts: Sequence[tuple[TopShift, LeftShift]], border_handling: BorderHandling
+    ) -> vs.VideoNode | None:
+        """
+        Constant shift done with a fixed separable convolution, or None if it can't be done this way.
+
+        Every output pixel of a shift sits at the same phase, so a single set of taps
+        per plane and axis is computed once and applied with ``std.Convolution``.
+        Planes sharing the same shift are processed by the same call.
+
+        Integer clips need the taps quantized to ``std.Convolution``'s 10-bit coefficients.
+        They're only used when the worst-case error of the quantized taps stays under half a code value,
+        which holds for most taps at 8-bit, but only for taps with few significant bits,
+        like half pixel bilinear shifts, at 16-bit. Other shifts keep using the resampler.
+
+        Convolution's own edges reflect around the edge pixel, unlike the resampler,
+        so the borders are always padded beforehand, mirrored the same way the resampler does it.
+
+        :param plane_shifts:    Shift of every plane, in that plane's own pixels.
+        """
+
+        assert clip.format
+
+        fmt = clip.format
+
+        if fmt.sample_type is vs.FLOAT and fmt.bits_per_sample != 32:
+            return None
+
+        peak = (1 << fmt.bits_per_sample) - 1
+
+        passes = list[tuple[str, list[float], list[int]]]()
+        pads = dict(h=0, v=0)
+
+        for mode, axis, subsampling in (('v', 0, fmt.subsampling_h), ('h', 1, fmt.subsampling_w)):
+            groups = dict[float, list[int]]()
+
+            for plane, plane_shift in enumerate(plane_shifts):
+                if plane_shift[axis]:
+                    groups.setdefault(plane_shift[axis], []).append(plane)
+
+            for plane_shift, planes in groups.items():
+                if (weights := self._get_shift_weights(plane_shift)) is None or len(weights) > 25:
+                    return None
+
+                if len(weights) < 3:
+                    weights = [0.0, *weights, 0.0]
+
+                if fmt.sample_type is vs.INTEGER:
+                    scale = 1023 / max(abs(w) for w in weights)
+                    quantized = [round(w * scale) for w in weights]
+                    divisor = sum(quantized)
+
+                    # Both sets of taps sum to 1, so the error peaks with the samples at 0 or peak
+                    # depending on its sign, at half the sum of the absolute errors
+                    if sum(abs(q / divisor - w) for q, w in zip(quantized, weights)) / 2 * peak >= 0.5:
+                        return None
+
+                    weights = quantized
+
+                passes.append((mode, weights, planes))
+
+                pad = (len(weights) // 2) << (subsampling if planes[-1] else 0)
+                pads[mode] = max(pads[mode], -(-pad >> subsampling) << subsampling)
+
+        if not passes:
+            return clip
+
+        padded = border_handling.pad(clip, pads['h'], pads['h'], pads['v'], pads['v'])
+
+        for mode, weights, planes in passes:
+            padded = padded.std.Convolution(weights, divisor=sum(weights), planes=planes, mode=mode)
+
+        return padded.std.Crop(pads['h'], pads['h'], pads['v'], pads['v'])
+
+    def _get_shift_weights(self, shift: float) -> list[float] | None:
+        """Normalized taps of a constant shift, centered on the output pixel, or None if not available."""
+
+        return None
+
+    @inject_self.cached
+    @inject_kwargs_params
+    def rescale(
+        self, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
+        shift: tuple[TopShift, LeftShift] | tuple[
+            TopShift | tuple[TopFieldTopShift, BotFieldTopShift],
+            LeftShift | tuple[TopFieldLeftShift, BotFieldLeftShift]
+        ] = (0, 0), *,
+        border_handling: BorderHandling = BorderHandling.MIRROR,
+        field_based: FieldBased | None = None,
+        planes: PlanesT = None,
+        precision: PrecisionPolicy = PrecisionPolicy.ORIGINAL,
+        **kwargs: Any
+    ) -> RescaleResult:
+        """
+        Descale and scale back to the input resolution with this kernel in a single pass.
+
+        The input is converted to 32-bit float once and every output shares that conversion.
+        Outputs are lazy, so the ones that aren't used cost nothing.
+
+        :param clip:        Input clip
+        :param width:       Descaled width
+        :param height:      Descaled height
+        :param shift:       Shift clip during the operation.
+                            Expects a tuple of (src_top, src_left),
+                            each either a single value or a pair of (top field, bottom field) values.
+        :param field_based: Descale and scale back each field on its own, defaults to the field order of the clip.
+        :param planes:      Planes to descale, either all of them or only the luma.
+        :param precision:   Precision of the descaled and rescaled outputs.
+                            The error clip is always 32-bit float.
+
+        :return:            The descaled clip, the rescaled clip and the absolute difference
+                            between the input and the rescaled clip, with the per-frame statistics of its first plane
+                            stored in the ``RescaleErrorAverage``, ``RescaleErrorMin`` and ``RescaleErrorMax`` props.
+        """
+
+        assert check_variable_format(clip, self.rescale)
+
+        clip, bits = expect_bits(clip, 32)
+
+        field_based = FieldBased.from_param_or_video(field_based, clip)
+
+        descaled = self.descale(
+            clip, width, height, shift, border_handling=border_handling, field_based=field_based, planes=planes,
+            precision=PrecisionPolicy.KEEP_FLOAT, **kwargs
+        )
+
+        if descaled.format.num_planes != clip.format.num_planes:
+            clip = get_y(clip)
+
+        kwargs = {k: v for k, v in kwargs.items() if k not in _descale_only_kwargs}
+
+        if border_handling != BorderHandling.MIRROR:
+            kwargs.update(border_handling=border_handling)
+
+        if field_based.is_inter:
+            rescaled = self._rescale_fields(descaled, clip, field_based.is_tff, shift, **kwargs)
+        else:
+            rescaled = self.scale(descaled, clip.width, clip.height, shift, **kwargs)  # type: ignore[arg-type]
+
+        error = core.std.Expr([clip, rescaled], 'x y - abs').std.PlaneStats(prop='RescaleError')
+
+        precision = PrecisionPolicy.from_param(precision, self.rescale)
+
+        return RescaleResult(precision.apply(descaled, bits), precision.apply(rescaled, bits), error)
+
+    def _rescale_fields(
+        self, descaled: vs.VideoNode, clip: vs.VideoNode, tff: bool, shift: tuple[Any, Any], **kwargs: Any
+    ) -> vs.VideoNode:
+        shift_y, shift_x = tuple[tuple[float, float], ...](
+            sh if isinstance(sh, tuple) else (sh, sh) for sh in shift
+        )
+
+        # Same field offsets as the descale, so each field is scaled back from where it was descaled
+        field_shift = 0.125 * descaled.height / clip.height
+
+        fields = descaled.std.SeparateFields(tff)
 
-        shifted_planes = [
-            plane if top == left == 0 else _shift(plane, (top, left))
-            for plane, top, left in zip(planes, shifts_top, shifts_left)
-        ]
+        rescaled = core.std.Interleave([
+            self.scale(fields, clip.width, clip.height // 2, (sh_y + field_shift * mult, sh_x), **kwargs)
+            for mult, sh_y, sh_x in zip((1, -1), shift_y, shift_x)
+        ]).std.SelectEvery(4, [0, 3])
 
-        return core.std.ShufflePlanes(shifted_planes, [0, 0, 0], clip.format.color_family)
+        return rescaled.std.DoubleWeave(tff)[::2]
 
     @overload
     @classmethod
@@ -601,7 +1291,7 @@ class Kernel(Scaler, Descaler, Resampler):
         )
 
     def get_implemented_funcs(self) -> tuple[Callable[..., Any], ...]:
-        return (self.shift, )  # type: ignore
+        return (self.shift, self.rescale)  # type: ignore
 
 
 ScalerT = Union[str, type[Scaler], Scaler]
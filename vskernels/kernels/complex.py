@@ -5,11 +5,14 @@ from typing import TYPE_CHECKING, Any, SupportsFloat, TypeVar, Union, cast
 
 from stgpytools import inject_kwargs_params
 from vstools import (
-    Dar, KwargsT, Resolution, Sar, VSFunctionAllArgs, check_correct_subsampling, fallback, inject_self, vs
+    CustomValueError, Dar, FieldBased, KwargsT, PlanesT, Resolution, Sar, VSFunctionAllArgs,
+    check_correct_subsampling, fallback, get_y, inject_self, normalize_planes, vs
 )
 
-from ..types import BorderHandling, Center, LeftShift, SampleGridModel, Slope, TopShift
-from .abstract import Descaler, Kernel, Resampler, Scaler
+from ..types import (
+    BorderHandling, Center, LeftShift, PrecisionPolicy, SampleGridModel, ScaleQuality, Slope, TopShift
+)
+from .abstract import Descaler, Kernel, Resampler, Scaler, _is_identity, _preview_kwargs
 from .custom import CustomKernel
 
 __all__ = [
@@ -51,10 +54,36 @@ class _BaseLinearOperation:
             self: _BaseLinearOperation, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
 
             shift: tuple[TopShift, LeftShift] = (0, 0), *,
-            linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, **kwargs: Any
+            linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, luma_only: bool = False,
+            quality: ScaleQuality = ScaleQuality.FULL, **kwargs: Any
         ) -> vs.VideoNode:
             from ..util import LinearLight
 
+            # Field-based descales shift each field even at the same size, like Descaler.descale
+            is_field_descale = op_name == 'descale' and (
+                FieldBased.from_param_or_video(kwargs.get('field_based'), clip).is_inter
+                or any(isinstance(sh, tuple) for sh in shift)
+            )
+
+            if not is_field_descale and _is_identity(clip, *Scaler._wh_norm(clip, width, height), shift, **kwargs):
+                return clip
+
+            quality = ScaleQuality.from_param(quality, func)
+
+            if op_name != 'scale' and quality is not ScaleQuality.FULL:
+                raise CustomValueError('Quality tiers are only available when scaling!', func, quality)
+
+            if quality is ScaleQuality.PREVIEW:
+                assert isinstance(self, Scaler)
+
+                if (preview := self.preview_scaler) is not self:
+                    return preview.scale(
+                        clip, width, height, shift, pyramid=True,
+                        **{k: v for k, v in kwargs.items() if k in _preview_kwargs}
+                    )
+
+                linear, sigmoid, kwargs['pyramid'] = False, False, True
+
             has_custom_op = hasattr(self, f'_linear_{op_name}')
             operation = cast(
                 VSFunctionAllArgs,
@@ -67,9 +96,19 @@ class _BaseLinearOperation:
             if not linear and not has_custom_op:
                 return operation(clip, width, height, shift, **kwargs)
 
+            # Planes can't be picked after going to RGB, so the luma has to be taken beforehand
+            if kwargs.get('planes') is not None and normalize_planes(clip, kwargs['planes']) == [0]:
+                clip, kwargs['planes'] = get_y(clip), None
+
             resampler: Resampler | None = self if isinstance(self, Resampler) else None
 
-            with LinearLight(clip, linear, sigmoid, resampler, kwargs.pop('format', None)) as ll:
+            out_fmt = kwargs.pop('format', None)
+
+            if (precision := kwargs.pop('precision', None)) is not None:
+                out_fmt = PrecisionPolicy.from_param(precision, func).get_format(fallback(out_fmt, clip))
+                kwargs['precision'] = PrecisionPolicy.KEEP_FLOAT
+
+            with LinearLight(clip, linear, sigmoid, resampler, out_fmt, luma_only) as ll:
                 ll.linear = operation(ll.linear, width, height, shift, **kwargs)  # type: ignore
 
             return ll.out
@@ -84,7 +123,8 @@ class LinearScaler(_BaseLinearOperation, Scaler):
         def scale(  # type: ignore[override]
             self, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
             shift: tuple[TopShift, LeftShift] = (0, 0),
-            *, linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, **kwargs: Any
+            *, linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, luma_only: bool = False,
+            quality: ScaleQuality = ScaleQuality.FULL, **kwargs: Any
         ) -> vs.VideoNode:
             ...
     else:
@@ -98,7 +138,8 @@ class LinearDescaler(_BaseLinearOperation, Descaler):
         def descale(  # type: ignore[override]
             self, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
             shift: tuple[TopShift, LeftShift] = (0, 0),
-            *, linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, **kwargs: Any
+            *, linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, luma_only: bool = False,
+            **kwargs: Any
         ) -> vs.VideoNode:
             ...
     else:
@@ -187,6 +228,9 @@ class KeepArScaler(Scaler):
     ) -> vs.VideoNode:
         width, height = Scaler._wh_norm(clip, width, height)
 
+        if _is_identity(clip, width, height, shift, sar=sar, dar=dar, dar_in=dar_in, keep_ar=keep_ar, **kwargs):
+            return clip
+
         check_correct_subsampling(clip, width, height)
 
         const_size = 0 not in (clip.width, clip.height)
@@ -199,7 +243,11 @@ class KeepArScaler(Scaler):
             kwargs, shift = sample_grid_model.for_dst(clip, width, height, shift, **kwargs)
 
             border_handling = BorderHandling.from_param(border_handling, self.scale)
-            padded = border_handling.prepare_clip(clip, self.kernel_radius)
+            padded = border_handling.prepare_clip(
+                clip, self.kernel_radius,
+                width != clip.width or bool(shift[1]) or kwargs.get('src_width', clip.width) != clip.width,
+                height != clip.height or bool(shift[0]) or kwargs.get('src_height', clip.height) != clip.height
+            )
 
             shift, clip = tuple(
                 s + ((p - c) // 2) for s, c, p in zip(shift, *((x.height, x.width) for x in (clip, padded)))
@@ -223,13 +271,13 @@ class ComplexScaler(LinearScaler, KeepArScaler):
         border_handling: BorderHandling = BorderHandling.MIRROR,
         sample_grid_model: SampleGridModel = SampleGridModel.MATCH_EDGES,
         sar: Sar | bool | float | None = None, dar: Dar | bool | float | None = None, keep_ar: bool | None = None,
-        linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False,
+        linear: bool = False, sigmoid: bool | tuple[Slope, Center] = False, luma_only: bool = False,
         **kwargs: Any
     ) -> vs.VideoNode:
         width, height = Scaler._wh_norm(clip, width, height)
         return super().scale(
             clip, width, height, shift, sar=sar, dar=dar, keep_ar=keep_ar,
-            linear=linear, sigmoid=sigmoid, border_handling=border_handling,
+            linear=linear, sigmoid=sigmoid, luma_only=luma_only, border_handling=border_handling,
             sample_grid_model=sample_grid_model, **kwargs
         )
 
@@ -246,8 +294,9 @@ class CustomComplexKernel(CustomKernel, ComplexKernel):  # type: ignore
             self, clip: vs.VideoNode, width: int, height: int, shift: tuple[TopShift, LeftShift] = (0, 0),
             *, blur: float = 1.0, border_handling: BorderHandling,
             sample_grid_model: SampleGridModel = SampleGridModel.MATCH_EDGES,
-            ignore_mask: vs.VideoNode | None = None, linear: bool = False,
-            sigmoid: bool | tuple[Slope, Center] = False, **kwargs: Any
+            ignore_mask: vs.VideoNode | None = None, planes: PlanesT = None,
+            precision: PrecisionPolicy = PrecisionPolicy.ORIGINAL, linear: bool = False,
+            sigmoid: bool | tuple[Slope, Center] = False, luma_only: bool = False, **kwargs: Any
         ) -> vs.VideoNode:
             ...
 
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from stgpytools import inject_kwargs_params
+from vstools import (
+    CustomValueError, FieldBased, HoldsVideoFormatT, MatrixT, VideoFormatT, check_variable_format, core,
+    get_video_format, inject_self, vs
+)
+
+from ..types import (
+    BorderHandling, BotFieldLeftShift, BotFieldTopShift, LeftShift, PrecisionPolicy, TopFieldLeftShift,
+    TopFieldTopShift, TopShift
+)
+from .abstract import Kernel, KernelT, Resampler, Scaler, ScalerT, _plane_shift
+
+__all__ = [
+    'PlaneScaler',
+    'AxisKernel'
+]
+
+_horizontal_kwargs = frozenset({'src_left', 'src_width'})
+_vertical_kwargs = frozenset({'src_top', 'src_height'})
+
+
+def _kernel_key(kernel: Scaler) -> Any:
+    try:
+        return kernel.to_spec()
+    except CustomValueError:
+        return id(kernel)
+
+
+class PlaneScaler(Scaler, Resampler):
+    """
+    Scaler using a different kernel per plane.
+
+    Kernels are given per plane, the last one is repeated for the remaining planes, e.g.
+    ``PlaneScaler([Spline36, Catrom])`` scales the luma with Spline36 and the chroma with Catrom.
+
+    Planes sharing a kernel are scaled with it by a single call on the whole clip, e.g. both chroma planes.
+    A plane with a kernel of its own is scaled alone, with its shift computed from the subsampling
+    and chroma location, so no shift has to be given by hand.
+    Kernels are matched by their spec, so equal kernels given as separate objects still share a call.
+
+    :param kernels: Kernel of each plane.
+    """
+
+    kernels: list[Scaler]
+    """Kernel of each plane, the last one is repeated for the remaining planes."""
+
+    def __init__(self, kernels: ScalerT | Sequence[ScalerT], **kwargs: Any) -> None:
+        if isinstance(kernels, (str, type, Scaler)):
+            kernels = [kernels]
+
+        self.kernels = [Scaler.ensure_obj(kernel, self.__class__) for kernel in kernels]
+
+        super().__init__(**kwargs)
+
+    def get_plane_kernels(self, clip: vs.VideoNode) -> list[Scaler]:
+        """Kernel used for every plane of the clip."""
+
+        assert clip.format
+
+        n_planes = clip.format.num_planes
+
+        return (self.kernels + self.kernels[-1:] * n_planes)[:n_planes]
+
+    @inject_self.cached
+    @inject_kwargs_params
+    def scale(
+        self, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
+        shift: tuple[TopShift, LeftShift] = (0, 0), **kwargs: Any
+    ) -> vs.VideoNode:
+        assert check_variable_format(clip, self.scale)
+
+        width, height = Scaler._wh_norm(clip, width, height)
+
+        groups = dict[Any, tuple[Scaler, list[int]]]()
+
+        for plane, kernel in enumerate(self.get_plane_kernels(clip)):
+            groups.setdefault(_kernel_key(kernel), (kernel, []))[1].append(plane)
+
+        if len(groups) == 1:
+            return self.kernels[0].scale(clip, width, height, shift, **kwargs)
+
+        fmt = clip.format
+
+        shift = (kwargs.pop('src_top', shift[0]), kwargs.pop('src_left', shift[1]))
+        src_width, src_height = kwargs.pop('src_width', clip.width), kwargs.pop('src_height', clip.height)
+
+        scaled = dict[int, tuple[vs.VideoNode, int]]()
+
+        for kernel, planes in groups.values():
+            # Resize places every plane of the clip from the same shift, chroma by its location,
+            # so a kernel shared by several planes scales them all at once
+            if len(planes) > 1:
+                full = kernel.scale(
+                    clip, width, height, shift, src_width=src_width, src_height=src_height, **kwargs
+                )
+                scaled |= {plane: (full, plane) for plane in planes}
+                continue
+
+            for plane in planes:
+                ss_w, ss_h = (fmt.subsampling_w, fmt.subsampling_h) if plane else (0, 0)
+
+                plane_shift = _plane_shift(
+                    clip, plane, shift, (src_height / height, src_width / width), self.scale
+                )
+
+                scaled[plane] = (kernel.scale(
+                    clip.std.ShufflePlanes(plane, vs.GRAY), width >> ss_w, height >> ss_h, plane_shift,
+                    src_width=src_width / (1 << ss_w), src_height=src_height / (1 << ss_h), **kwargs
+                ), 0)
+
+        clips, planes = zip(*(scaled[plane] for plane in range(fmt.num_planes)))
+
+        return core.std.ShufflePlanes(list(clips), list(planes), fmt.color_family)
+
+    @inject_self.cached
+    @inject_kwargs_params
+    def resample(
+        self, clip: vs.VideoNode, format: int | VideoFormatT | HoldsVideoFormatT,
+        matrix: MatrixT | None = None, matrix_in: MatrixT | None = None, **kwargs: Any
+    ) -> vs.VideoNode:
+        """
+        Resample with the chroma kernel.
+
+        The luma is never resized when converting formats, so the kernel of the chroma planes
+        is the only one that has an effect.
+        """
+
+        resampler = self.get_plane_kernels(clip)[-1]
+
+        if not isinstance(resampler, Resampler):
+            raise CustomValueError('The chroma kernel must be a Resampler!', self.resample, resampler)
+
+        return resampler.resample(clip, format, matrix, matrix_in, **kwargs)
+
+    @inject_self.cached.property
+    def kernel_radius(self) -> int:  # type: ignore
+        return max(kernel.kernel_radius for kernel in self.kernels)
+
+
+class AxisKernel(Kernel):
+    """
+    Kernel using a different kernel for each axis.
+
+    For example ``AxisKernel(Bilinear, Bicubic)`` upscales with Bilinear horizontally and Bicubic vertically.
+
+    Every operation is done as two one-dimensional passes, starting with the one that gives
+    the smaller intermediate clip. An axis that isn't touched by the operation is skipped.
+
+    :param horizontal:  Kernel used for the horizontal axis.
+    :param vertical:    Kernel used for the vertical axis.
+    """
+
+    horizontal: Kernel
+    """Kernel used for the horizontal axis."""
+
+    vertical: Kernel
+    """Kernel used for the vertical axis."""
+
+    def __init__(self, horizontal: KernelT, vertical: KernelT, **kwargs: Any) -> None:
+        self.horizontal = Kernel.ensure_obj(horizontal, self.__class__)
+        self.vertical = Kernel.ensure_obj(vertical, self.__class__)
+
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def _split_kwargs(kwargs: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+        return (
+            {k: v for k, v in kwargs.items() if k not in _vertical_kwargs},
+            {k: v for k, v in kwargs.items() if k not in _horizontal_kwargs}
+        )
+
+    @inject_self.cached
+    @inject_kwargs_params
+    def scale(  # type: ignore[override]
+        self, clip: vs.VideoNode, width: int | None = None, height: int | None = None,
+        shift: tuple[TopShift, LeftShift] = (0, 0), **kwargs: Any
+    ) -> vs.VideoNode:
+        width, height = Scaler._wh_norm(clip, width, height)
+
+        h_kwargs, v_kwargs = self._split_kwargs(kwargs)
+
+        if width * clip.height <= clip.width * height:
+            clip = self.horizontal.scale(clip, width, clip.height, (0, shift[1]), **h_kwargs)
+            return self.vertical.scale(clip, width, height, (shift[0], 0), **v_kwargs)
+
+        clip = self.vertical.scale(clip, clip.width, height, (shift[0], 0), **v_kwargs)
+        return self.horizontal.scale(clip, width, height, (0, shift[1]), **h_kwargs)
+
+    @inject_self.cached
+    @inject_kwargs_params
+    def descale(  # type: ignore[override]
+        self, clip: vs.VideoNode, width: int | None, height: int | None,
+        shift: tuple[TopShift, LeftShift] | tuple[
+            TopShift | tuple[TopFieldTopShift, BotFieldTopShift],
+            LeftShift | tuple[TopFieldLeftShift, BotFieldLeftShift]
+        ] = (0, 0), *,
+        precision: PrecisionPolicy = PrecisionPolicy.ORIGINAL,
+        **kwargs: Any
+    ) -> vs.VideoNode:
+        assert check_variable_format(clip, self.descale)
+
+        width, height = Scaler._wh_norm(clip, width, height)
+
+        bits = get_video_format(clip).bits_per_sample
+
+        h_kwargs, v_kwargs = self._split_kwargs(kwargs | dict(precision=PrecisionPolicy.KEEP_FLOAT))
+
+        # Fields only differ vertically, so the horizontal pass always descales whole frames
+        h_kwargs |= dict(field_based=FieldBased.PROGRESSIVE)
+
+        shift_left = shift[1]
+
+        if isinstance(shift_left, tuple):
+            if shift_left[0] != shift_left[1]:
+                raise CustomValueError(
+                    'You can\'t descale with a different horizontal shift per field!', self.descale, shift_left
+                )
+
+            shift_left = shift_left[0]
+
+        if width * clip.height <= clip.width * height:
+            descaled = self.horizontal.descale(clip, width, clip.height, (0, shift_left), **h_kwargs)
+            descaled = self.vertical.descale(descaled, width, height, (shift[0], 0), **v_kwargs)
+        else:
+            descaled = self.vertical.descale(clip, clip.width, height, (shift[0], 0), **v_kwargs)
+            descaled = self.horizontal.descale(descaled, width, height, (0, shift_left), **h_kwargs)
+
+        return PrecisionPolicy.from_param(precision, self.descale).apply(descaled, bits)
+
+    @inject_self.cached
+    @inject_kwargs_params
+    def resample(  # type: ignore[override]
+        self, clip: vs.VideoNode, format: int | VideoFormatT | HoldsVideoFormatT,
+        matrix: MatrixT | None = None, matrix_in: MatrixT | None = None, **kwargs: Any
+    ) -> vs.VideoNode:
+        """
+        Resample the chroma horizontally, then vertically.
+
+        The horizontal pass goes to an intermediate 32-bit float YUV format with the horizontal subsampling
+        of the output and the vertical subsampling of the input.
+        """
+
+        assert check_variable_format(clip, self.resample)
+
+        fmt = get_video_format(format)
+
+        if vs.YUV not in (clip.format.color_family, fmt.color_family):
+            return self.horizontal.resample(clip, fmt, matrix, matrix_in, **kwargs)
+
+        if clip.format.color_family is vs.YUV:
+            mid_fmt = clip.format.replace(subsampling_w=fmt.subsampling_w if fmt.color_family is vs.YUV else 0)
+        else:
+            mid_fmt = fmt.replace(subsampling_h=0)
+
+        # The intermediate is kept in float, so only the final pass rounds to the output format
+        mid_fmt = mid_fmt.replace(sample_type=vs.FLOAT, bits_per_sample=32)
+
+        if clip.format.color_family is vs.YUV:
+            clip = self.horizontal.resample(clip, mid_fmt, **kwargs)
+        else:
+            clip = self.horizontal.resample(clip, mid_fmt, matrix, matrix_in, **kwargs)
+            matrix = matrix_in = None
+
+        return self.vertical.resample(clip, fmt, matrix, matrix_in, **kwargs)
+
+    def _shift_clip(
+        self, clip: vs.VideoNode, shift: tuple[TopShift, LeftShift],
+        border_handling: BorderHandling, **kwargs: Any
+    ) -> vs.VideoNode:
+        h_kwargs, v_kwargs = self._split_kwargs(kwargs)
+
+        clip = self.vertical._shift_clip(clip, (shift[0], 0), border_handling, **v_kwargs)
+
+        return self.horizontal._shift_clip(clip, (0, shift[1]), border_handling, **h_kwargs)
+
+    @inject_self.cached.property
+    def is_interpolating(self) -> bool:
+        return self.horizontal.is_interpolating and self.vertical.is_interpolating
+
+    @inject_self.cached.property
+    def kernel_radius(self) -> int:  # type: ignore
+        return max(self.horizontal.kernel_radius, self.vertical.kernel_radius)
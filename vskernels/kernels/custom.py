@@ -1,20 +1,30 @@
 from __future__ import annotations
 from stgpytools import CustomValueError, DependencyNotFoundError, KwargsT, inject_self
 from inspect import Signature
-from math import ceil
+from math import ceil, floor, isclose
 
-from vstools import vs, core
-from typing import Any, Protocol
+from vstools import core, fallback, vs
+from typing import TYPE_CHECKING, Any, Protocol
 from .abstract import Kernel
+from ..array import AxisWeights, get_axis_weights, scale_axis, scale_banded
+from ..cache import _cached_axis_weights, cached_array, kernel_fingerprint
+from ..types import BorderHandling, LeftShift, TopShift
 
 from typing import TypeVar
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+else:
+    NDArray = Any
 
 __all__ = [
     'CustomKernel'
 ]
 
 
+_array_descale_kwargs = frozenset({'width', 'height', 'src_top', 'src_left', 'border_handling', 'blur', 'taps'})
+
+
 class _kernel_func(Protocol):
     def __call__(self, *, x: float) -> float:
         ...
@@ -24,6 +34,16 @@ class CustomKernel(Kernel):
     def kernel(self, *, x: float) -> float:
         raise NotImplementedError
 
+    @inject_self.cached.property
+    def is_interpolating(self) -> bool:
+        if float(self.kwargs.get('blur', 1.0)) != 1.0:
+            return False
+
+        if not isclose(self.kernel(x=0.0), 1.0):
+            return False
+
+        return all(isclose(self.kernel(x=float(x)), 0.0, abs_tol=1e-9) for x in range(1, self.kernel_radius + 1))
+
     def _modify_kernel_func(self, kwargs: KwargsT) -> tuple[_kernel_func, float]:
         blur = float(kwargs.pop('blur', 1.0))
         taps = int(kwargs.pop('taps', self.kernel_radius))
@@ -37,6 +57,234 @@ class CustomKernel(Kernel):
 
         return self.kernel, support
 
+    def _get_shift_weights(self, shift: float) -> list[float] | None:
+        kernel, support = self._modify_kernel_func(dict(self.kwargs))
+
+        if not (taps := ceil(support)):
+            return None
+
+        first = floor(shift) - taps + 1
+
+        weights = {x: kernel(x=x - shift) for x in range(first, first + taps * 2)}
+
+        if not any(weights.values()):
+            return None
+
+        radius = max(abs(x) for x, weight in weights.items() if weight)
+
+        matrix = [weights.get(x, 0.0) for x in range(-radius, radius + 1)]
+
+        if not (total := sum(matrix)):
+            return None
+
+        return [weight / total for weight in matrix]
+
+    def get_axis_weights(
+        self, src_size: int, dst_size: int, shift: float = 0.0, src_window: float | None = None,
+        border_handling: BorderHandling = BorderHandling.MIRROR, **kwargs: Any
+    ) -> AxisWeights:
+        """
+        Taps of this kernel for resampling one axis.
+
+        :param src_size:        Size of the source axis.
+        :param dst_size:        Size of the output axis.
+        :param shift:           Position of the source window, in source samples.
+        :param src_window:      Size of the source window. Defaults to the whole axis.
+        :param border_handling: How samples outside of the axis are read, folded into the taps at the edges.
+        """
+
+        border_handling = BorderHandling.from_param(border_handling, self.get_axis_weights)
+
+        def _compute() -> AxisWeights:
+            kernel, support = self._modify_kernel_func(self.kwargs | kwargs)
+
+            return get_axis_weights(
+                kernel, support, src_size, dst_size, shift, src_window, border_handling=border_handling
+            )
+
+        return _cached_axis_weights((
+            kernel_fingerprint(self), sorted((k, repr(v)) for k, v in kwargs.items()),
+            src_size, dst_size, shift, src_window, int(border_handling)
+        ), _compute)
+
+    def get_descale_solution(
+        self, size: int, dst_size: int, shift: float = 0.0,
+        border_handling: BorderHandling = BorderHandling.MIRROR, **kwargs: Any
+    ) -> NDArray[Any]:
+        """
+        Least squares solution of descaling one axis, as a (dst_size, size) matrix applied to the samples.
+
+        It's computed from the normal equations of the scaling from ``dst_size`` to ``size``,
+        and memoized through :py:func:`cached_array`.
+
+        :param size:            Size of the axis being descaled.
+        :param dst_size:        Descaled size.
+        :param shift:           Shift of the descaled source.
+        :param border_handling: How samples outside of the descaled axis were read when it was scaled.
+        """
+
+        import numpy as np
+
+        border_handling = BorderHandling.from_param(border_handling, self.get_descale_solution)
+
+        def _compute() -> NDArray[Any]:
+            scaling = self.get_axis_weights(dst_size, size, shift, None, border_handling, **kwargs).matrix()
+
+            return np.linalg.solve(scaling.T @ scaling, scaling.T)
+
+        return cached_array((
+            'descale_solution', kernel_fingerprint(self), sorted((k, repr(v)) for k, v in kwargs.items()),
+            size, dst_size, shift, int(border_handling)
+        ), _compute)
+
+    def scale_array(
+        self, array: NDArray[Any], width: int | None = None, height: int | None = None,
+        shift: tuple[TopShift, LeftShift] = (0, 0), *,
+        src_width: float | None = None, src_height: float | None = None,
+        border_handling: BorderHandling = BorderHandling.MIRROR, bits: int | None = None,
+        out: NDArray[Any] | None = None, max_memory: int | None = None, **kwargs: Any
+    ) -> NDArray[Any]:
+        """
+        Scale the last two axes of an array, (height, width), with this kernel.
+
+        This is a NumPy implementation of :py:attr:`scale`, for planes that aren't in a VideoNode.
+        Integer scaling factors only evaluate the taps of a single period and apply them to strided views.
+        An axis that doesn't change is skipped, and the axis that gives the smaller intermediate goes first.
+        Border handling is done by the taps at the edges instead of padding the array.
+
+        When ``out`` or ``max_memory`` is given, the planes are processed in bands of output rows
+        with :py:func:`scale_banded`, each band reading its rows plus a halo as wide as the kernel's support
+        and writing straight into the output, bounding peak memory on large planes and long stacks of them.
+
+        :param array:           Array to scale. Integer arrays are returned as 32-bit float,
+                                unless ``bits`` is given.
+        :param width:           Output width.
+        :param height:          Output height.
+        :param shift:           Shift of the source, as (src_top, src_left).
+        :param src_width:       Width of the source window.
+        :param src_height:      Height of the source window.
+        :param border_handling: How samples outside of the array are read.
+        :param bits:            Bit depth of an integer array. It's then scaled with 14-bit fixed-point taps
+                                and returned with its type, each pass rounding and clamping to the bit depth.
+        :param out:             Preallocated output, e.g. a frame buffer.
+        :param max_memory:      Approximate memory in bytes the intermediates of a band can take.
+        """
+
+        src_h, src_w = array.shape[-2:]
+        width, height = fallback(width, src_w), fallback(height, src_h)
+
+        horizontal, vertical = (
+            self.get_axis_weights(size, dst, offset, window, border_handling, **kwargs)
+            if size != dst or offset or fallback(window, size) != size else None
+            for size, dst, offset, window in (
+                (src_w, width, shift[1], src_width), (src_h, height, shift[0], src_height)
+            )
+        )
+
+        if out is not None or max_memory is not None:
+            return scale_banded(array, horizontal, vertical, out, max_memory, bits)
+
+        passes = [(axis, weights) for axis, weights in ((-1, horizontal), (-2, vertical)) if weights is not None]
+
+        if width * src_h > src_w * height:
+            passes.reverse()
+
+        for axis, weights in passes:
+            array = scale_axis(array, weights, axis, bits)
+
+        return array
+
+    def descale_array(
+        self, array: NDArray[Any], width: int | None = None, height: int | None = None,
+        shift: tuple[TopShift, LeftShift] = (0, 0), *,
+        border_handling: BorderHandling = BorderHandling.MIRROR, **kwargs: Any
+    ) -> NDArray[Any]:
+        """
+        Descale the last two axes of an array, (height, width), with this kernel.
+
+        This is a NumPy implementation of :py:attr:`descale`, solving the least squares problem of each axis
+        through its normal equations, like the descale plugin does. The solution of an axis only depends
+        on its geometry, so it's computed once, or read from the cache,
+        and applied to every row or column, and to every leading axis.
+
+        :param array:           Array to descale. Integer arrays are returned as 32-bit float.
+        :param width:           Descaled width.
+        :param height:          Descaled height.
+        :param shift:           Shift of the descaled source, as (src_top, src_left).
+        :param border_handling: How samples outside of the descaled array were read when it was scaled.
+        """
+
+        import numpy as np
+
+        dtype = array.dtype if np.issubdtype(array.dtype, np.floating) else np.dtype(np.float32)
+
+        src_h, src_w = array.shape[-2:]
+        width, height = fallback(width, src_w), fallback(height, src_h)
+
+        array = np.asarray(array, dtype)
+
+        for axis, size, dst, offset in ((-1, src_w, width, shift[1]), (-2, src_h, height, shift[0])):
+            if size == dst and not offset:
+                continue
+
+            if dst > size:
+                raise CustomValueError(
+                    'Output dimension ({dst}) must be less than or equal to input dimension ({size}).',
+                    self.descale_array, dst=dst, size=size
+                )
+
+            solution = self.get_descale_solution(size, dst, offset, border_handling, **kwargs).astype(dtype)
+
+            array = np.moveaxis(np.moveaxis(array, axis, -1) @ solution.T, -1, axis)
+
+        return array
+
+    def _descale_fields(
+        self, clip: vs.VideoNode, tff: bool, fields_kwargs: tuple[KwargsT, KwargsT], field_shift: float
+    ) -> vs.VideoNode:
+        """
+        Descale both fields of the woven frames in a single node with :py:attr:`descale_array`.
+
+        Each field is read from and written to a strided view of its rows, so the frames are never
+        separated and woven back. Without numpy, or with arguments the array path doesn't take,
+        the fields go through the descale plugin.
+        """
+
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return super()._descale_fields(clip, tff, fields_kwargs, field_shift)
+
+        if not all(de_kwargs.keys() <= _array_descale_kwargs for de_kwargs in fields_kwargs):
+            return super()._descale_fields(clip, tff, fields_kwargs, field_shift)
+
+        from ..bridge import array_filter
+
+        assert clip.format
+
+        fmt = clip.format
+
+        # The first field is on the even rows of tff frames, and is shifted the same way as the separated fields
+        fields = [
+            (parity, de_kwargs | dict(src_top=de_kwargs.get('src_top', 0.0) + field_shift * mult))
+            for parity, mult, de_kwargs in zip((int(not tff), int(tff)), (1, -1), fields_kwargs)
+        ]
+
+        def _descale(src: NDArray[Any], dst: NDArray[Any], plane: int) -> None:
+            ss_w, ss_h = (fmt.subsampling_w, fmt.subsampling_h) if plane else (0, 0)
+
+            for parity, de_kwargs in fields:
+                de_kwargs = dict(de_kwargs)
+
+                width, height = de_kwargs.pop('width') >> ss_w, de_kwargs.pop('height') >> ss_h
+                shift = (de_kwargs.pop('src_top', 0.0) / (1 << ss_h), de_kwargs.pop('src_left', 0.0) / (1 << ss_w))
+
+                dst[parity::2] = self.descale_array(src[parity::2], width, height, shift, **de_kwargs)
+
+        return array_filter(
+            clip, _descale, fields_kwargs[0]['width'], fields_kwargs[0]['height'] * 2, func=self.descale
+        )
+
     @inject_self
     def scale_function(  # type: ignore[override]
         self, clip: vs.VideoNode, width: int | None = None, height: int | None = None, *args: Any, **kwargs: Any
@@ -1,7 +1,7 @@
-from math import floor, pi, sin
+from math import cos, floor, pi, sin, sqrt
 
 __all__ = [
-    'sinc', 'poly3', 'round_halfup', 'bic_vals'
+    'sinc', 'jinc', 'bessel_j1', 'poly3', 'round_halfup', 'bic_vals'
 ]
 
 
@@ -39,6 +39,38 @@ def sinc(x: float) -> float:
     return 1.0 if x == 0.0 else sin(x * pi) / (x * pi)
 
 
+def bessel_j1(x: float) -> float:
+    """Bessel function of the first kind of order one, with the rational approximations of Numerical Recipes."""
+
+    ax = abs(x)
+
+    if ax < 8.0:
+        y = x * x
+        num = x * (72362614232.0 + y * (-7895059235.0 + y * (242396853.1 + y * (
+            -2972611.439 + y * (15704.48260 + y * -30.16036606)
+        ))))
+        den = 144725228442.0 + y * (2300535178.0 + y * (18583304.74 + y * (
+            99447.43394 + y * (376.9991397 + y)
+        )))
+
+        return num / den
+
+    z = 8.0 / ax
+    y = z * z
+    xx = ax - 2.356194491
+
+    p = 1.0 + y * (0.183105e-2 + y * (-0.3516396496e-4 + y * (0.2457520174e-5 + y * -0.240337019e-6)))
+    q = 0.04687499995 + y * (-0.2002690873e-3 + y * (0.8449199096e-5 + y * (-0.88228987e-6 + y * 0.105787412e-6)))
+
+    ans = sqrt(0.636619772 / ax) * (cos(xx) * p - z * sin(xx) * q)
+
+    return -ans if x < 0.0 else ans
+
+
+def jinc(x: float) -> float:
+    return 1.0 if x == 0.0 else 2.0 * bessel_j1(x * pi) / (x * pi)
+
+
 def poly3(x: float, c0: float, c1: float, c2: float, c3: float) -> float:
     return c0 + x * (c1 + x * (c2 + x * c3))
 
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from math import ceil
-from typing import Any, Callable
+from math import ceil, cos, pi
+from typing import TYPE_CHECKING, Any, Callable
 
 from stgpytools import inject_kwargs_params
-from vstools import core, fallback, inject_self, vs
+from vstools import (
+    CustomValueError, DependencyNotFoundError, core, fallback, inject_self, vs
+)
 
 from ..types import LeftShift, TopShift
+from .abstract import Scaler, _plane_shift
 from .complex import LinearScaler
+from .helpers import jinc, sinc
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+else:
+    NDArray = Any
 
 __all__ = [
     'Placebo',
@@ -21,6 +30,43 @@ __all__ = [
 ]
 
 
+_jinc_zero = 1.2196698912665045
+_jinc_default_radius = 3.2383154841662362076499
+
+
+def _ewa_filter(
+    filter: str, radius: float | None, param1: float | None, param2: float | None
+) -> tuple[Callable[..., float], float]:
+    from .bicubic import Bicubic, Robidoux, RobidouxSharp
+
+    if filter in {'ewa_robidoux', 'ewa_robidouxsharp'}:
+        if param1 is not None or param2 is not None:
+            bicubic = Bicubic(fallback(param1, 0), fallback(param2, 0.5))
+        else:
+            bicubic = Robidoux() if filter == 'ewa_robidoux' else RobidouxSharp()
+
+        return bicubic.kernel, radius or 2
+
+    radius = radius or _jinc_default_radius
+
+    windows: dict[str, Callable[[float], float]] = {
+        'ewa_jinc': lambda x: 1.0,
+        'ewa_lanczos': lambda x: jinc(x * _jinc_zero / radius),
+        'ewa_ginseng': lambda x: sinc(x / radius),
+        'ewa_hann': lambda x: 0.5 + 0.5 * cos(pi * x / radius)
+    }
+
+    if filter not in windows:
+        raise CustomValueError('The CPU fallback doesn\'t support the "{filter}" filter!', _ewa_filter, filter=filter)
+
+    window = windows[filter]
+
+    def kernel(*, x: float) -> float:
+        return jinc(x) * window(x) if x < radius else 0.0
+
+    return kernel, radius
+
+
 class Placebo(LinearScaler):
     """
     Abstract Placebo scaler.
@@ -28,6 +74,8 @@ class Placebo(LinearScaler):
     Dependencies:
 
     * vs-placebo <https://github.com/sgt0/vs-placebo>`_
+
+    When vs-placebo isn't loaded, scaling falls back to a CPU implementation running on NumPy.
     """
 
     _kernel: str
@@ -46,7 +94,83 @@ class Placebo(LinearScaler):
     # Quality settings
     antiring: float
 
-    scale_function = core.lazy.placebo.Resample
+    @inject_self
+    def scale_function(  # type: ignore[override]
+        self, clip: vs.VideoNode, width: int | None = None, height: int | None = None, *args: Any, **kwargs: Any
+    ) -> vs.VideoNode:
+        if hasattr(core, 'placebo'):
+            return core.placebo.Resample(clip, width, height, *args, **kwargs)
+
+        return self._cpu_resample(clip, width, height, **kwargs)
+
+    def _cpu_resample(
+        self, clip: vs.VideoNode, width: int | None, height: int | None, *,
+        filter: str, radius: float | None = None, param1: float | None = None, param2: float | None = None,
+        clamp: float = 0.0, taper: float = 0.0, blur: float = 0.0, antiring: float = 0.0,
+        sx: float = 0.0, sy: float = 0.0, src_width: float | None = None, src_height: float | None = None,
+        **kwargs: Any
+    ) -> vs.VideoNode:
+        try:
+            import numpy as np
+        except ImportError:
+            raise DependencyNotFoundError(
+                self.__class__, 'placebo', 'Missing dependency \'placebo\'! Either install vs-placebo, '
+                'or numpy for the CPU fallback.'
+            )
+
+        from ..array import scale_ewa
+        from ..bridge import array_filter
+
+        assert clip.format
+
+        if unsupported := {k for k, v in kwargs.items() if v and k != 'log_level'}:
+            raise CustomValueError(
+                'The CPU fallback doesn\'t support these arguments: {args}', self.scale_function,
+                args=', '.join(sorted(unsupported))
+            )
+
+        width, height = fallback(width, clip.width), fallback(height, clip.height)
+        src_width, src_height = fallback(src_width, clip.width), fallback(src_height, clip.height)
+
+        base_kernel, base_radius = _ewa_filter(filter, radius, param1, param2)
+
+        blur = blur or 1.0
+        flat = taper * base_radius
+
+        def kernel(*, x: float) -> float:
+            x = max(0.0, x / blur - flat) * base_radius / (base_radius - flat)
+
+            weight = base_kernel(x=x)
+
+            return weight * (1.0 - clamp) if weight < 0.0 else weight
+
+        planes_args = list[tuple[Any, ...]]()
+
+        for plane in range(clip.format.num_planes):
+            ss_w, ss_h = (clip.format.subsampling_w, clip.format.subsampling_h) if plane else (0, 0)
+
+            plane_shift = _plane_shift(
+                clip, plane, (sy, sx), (src_height / height, src_width / width), self.scale_function
+            )
+
+            planes_args.append((
+                width >> ss_w, height >> ss_h, kernel, base_radius * blur, plane_shift,
+                src_width / (1 << ss_w), src_height / (1 << ss_h), antiring
+            ))
+
+        is_integer = clip.format.sample_type is vs.INTEGER
+        peak = (1 << clip.format.bits_per_sample) - 1
+
+        def _resample(src: NDArray[Any], dst: NDArray[Any], plane: int) -> None:
+            if not is_integer:
+                scale_ewa(src, *planes_args[plane], out=dst)
+                return
+
+            scaled = scale_ewa(src, *planes_args[plane])
+
+            np.copyto(dst, np.clip(np.rint(scaled), 0, peak), 'unsafe')
+
+        return array_filter(clip, _resample, width, height, threads=1, func=self.scale_function)
 
     def __init__(
         self,
@@ -86,6 +210,15 @@ class Placebo(LinearScaler):
             antiring=self.antiring,
         ) | kwargs
 
+    @inject_self.cached.property
+    def preview_scaler(self) -> Scaler:
+        from .bicubic import Bicubic, Catrom, Robidoux, RobidouxSharp
+
+        if self.b is not None or self.c is not None:
+            return Bicubic(fallback(self.b, 0), fallback(self.c, 0.5))
+
+        return {'ewa_robidoux': Robidoux, 'ewa_robidouxsharp': RobidouxSharp}.get(self._kernel, Catrom)()
+
     @inject_self.cached.property
     def kernel_radius(self) -> int:  # type: ignore
         from .bicubic import Bicubic
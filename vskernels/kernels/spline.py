@@ -5,6 +5,7 @@ from typing import Any
 
 from vstools import inject_self
 
+from ..cache import cached_array
 from .complex import CustomComplexTapsKernel
 from .helpers import poly3
 
@@ -25,7 +26,11 @@ class Spline(CustomComplexTapsKernel):
         if hasattr(self, '_static_coeffs'):
             self._coefs = self._static_coeffs
         else:
-            self._coefs = self._splineKernelCoeff()
+            import numpy as np
+
+            self._coefs = cached_array(
+                ('spline_coeffs', self.kernel_radius), lambda: np.array(self._splineKernelCoeff())
+            ).tolist()
 
     def _naturalCubicSpline(self, values: list[int]) -> list[float]:
         import numpy as np
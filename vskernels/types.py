@@ -3,10 +3,12 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Any, TypeAlias
 
-from vstools import CustomIntEnum, KwargsT, padder, vs
+from vstools import (
+    CustomIntEnum, CustomStrEnum, HoldsVideoFormatT, KwargsT, VideoFormatT, depth, get_video_format, padder, vs
+)
 
 __all__ = [
-    'BorderHandling', 'SampleGridModel'
+    'BorderHandling', 'SampleGridModel', 'PrecisionPolicy', 'ScaleQuality'
 ]
 
 
@@ -15,15 +17,23 @@ class BorderHandling(CustomIntEnum):
     ZERO = 1
     REPEAT = 2
 
-    def prepare_clip(self, clip: vs.VideoNode, min_pad: int = 2) -> vs.VideoNode:
+    def prepare_clip(
+        self, clip: vs.VideoNode, min_pad: int = 2, horizontal: bool = True, vertical: bool = True
+    ) -> vs.VideoNode:
+        """Pad the clip for the kernel, only on the axes the operation touches."""
+
         pad_w, pad_h = (
-            self.pad_amount(size, min_pad) for size in (clip.width, clip.height)
+            self.pad_amount(size, min_pad) if padded else 0
+            for size, padded in ((clip.width, horizontal), (clip.height, vertical))
         )
 
         if pad_w == pad_h == 0:
             return clip
 
-        args = (clip, pad_w, pad_w, pad_h, pad_h)
+        return self.pad(clip, pad_w, pad_w, pad_h, pad_h)
+
+    def pad(self, clip: vs.VideoNode, left: int = 0, right: int = 0, top: int = 0, bottom: int = 0) -> vs.VideoNode:
+        args = (clip, left, right, top, bottom)
 
         match self:
             case BorderHandling.MIRROR:
@@ -77,6 +87,44 @@ class SampleGridModel(CustomIntEnum):
         return self(width, height, src_width, src_height, shift, kwargs)
 
 
+class PrecisionPolicy(CustomIntEnum):
+    ORIGINAL = 0
+    """Dither the output back to the input bitdepth."""
+
+    KEEP_FLOAT = 1
+    """Return 32-bit float, skipping the conversion back."""
+
+    HALF = 2
+    """Return 16-bit float, halving the memory of the following steps."""
+
+    def get_format(self, fmt: int | VideoFormatT | HoldsVideoFormatT) -> vs.VideoFormat:
+        fmt = get_video_format(fmt)
+
+        if self is PrecisionPolicy.ORIGINAL:
+            return fmt
+
+        return fmt.replace(sample_type=vs.FLOAT, bits_per_sample=16 if self is PrecisionPolicy.HALF else 32)
+
+    def apply(self, clip: vs.VideoNode, bits: int) -> vs.VideoNode:
+        if self is PrecisionPolicy.ORIGINAL:
+            return depth(clip, bits)
+
+        return depth(clip, self.get_format(clip))
+
+
+class ScaleQuality(CustomStrEnum):
+    FULL = 'full'
+    """Scale with the kernel and settings as given."""
+
+    PREVIEW = 'preview'
+    """
+    Trade quality for speed, e.g. for interactive previews.
+
+    Wide kernels are replaced by a cheaper kernel of similar character, linear light and sigmoid are skipped
+    and large downscales go through :py:attr:`Scaler.scale`'s pyramid.
+    """
+
+
 TopShift: TypeAlias = float
 LeftShift: TypeAlias = float
 TopFieldTopShift: TypeAlias = float
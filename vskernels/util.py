@@ -1,23 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import wraps
 from math import exp
-from typing import Any, ClassVar, cast
+from threading import RLock
+from typing import Any, Callable, ClassVar, cast
+from weakref import WeakValueDictionary
 
 from stgpytools import inject_kwargs_params
 from vstools import (
     ConstantFormatVideoNode, CustomRuntimeError, CustomValueError, HoldsVideoFormatT, InvalidTransferError, Matrix,
-    MatrixT, Transfer, cachedproperty, depth, get_video_format, inject_self, to_singleton, vs
+    MatrixT, Transfer, cachedproperty, core, depth, get_video_format, get_y, inject_self, to_singleton, vs
 )
 
 from .kernels import (
     Bicubic, BicubicAuto, Catrom, ComplexKernel, CustomComplexKernel, Descaler, Kernel, KernelT, LinearDescaler,
     Placebo, Point, Resampler, ResamplerT, Scaler
 )
+from .kernels.abstract import _spec_wrappers
 from .types import Center, LeftShift, Slope, TopShift
 
 __all__ = [
     'abstract_kernels', 'excluded_kernels',
+    'kernel_wrapper',
     'NoShift', 'NoScale',
 
     'LinearLight',
@@ -26,6 +31,45 @@ __all__ = [
 ]
 
 
+_wrapper_lock = RLock()
+
+_wrapper_classes = WeakValueDictionary[tuple[str, type], type]()
+"""Wrapper classes by name and base class, held weakly so unused ones can be collected."""
+
+
+def kernel_wrapper(name: str) -> Callable[[Callable[[type[Kernel]], type[Kernel]]], Callable[[KernelT], type[Kernel]]]:
+    """
+    Decorator memoizing a factory of wrapper kernel classes, like :py:attr:`NoShift.from_kernel`.
+
+    The factory is called once per base kernel class, every following call returns the same class
+    for as long as it's in use, so type-keyed caches keep working and loops building graphs don't create
+    a class per call. Wrappers are held weakly, so the ones that aren't used anymore are collected
+    along with their base class.
+
+    The wrapper classes can be written in kernel specs as ``name[kernel]``, e.g. ``NoShift[Lanczos]``.
+
+    :param name:    Name of the wrapper in specs. It must be unique.
+    """
+
+    def _decorator(factory: Callable[[type[Kernel]], type[Kernel]]) -> Callable[[KernelT], type[Kernel]]:
+        @wraps(factory)
+        def _wrapper(kernel: KernelT) -> type[Kernel]:
+            kernel_t = Kernel.from_param(kernel)
+
+            with _wrapper_lock:
+                if (wrapped := _wrapper_classes.get((name, kernel_t))) is None:
+                    wrapped = _wrapper_classes[(name, kernel_t)] = factory(kernel_t)
+                    type.__setattr__(wrapped, '_wrapper_spec', (name, kernel_t))
+
+            return wrapped
+
+        _spec_wrappers[name.lower()] = _wrapper
+
+        return _wrapper
+
+    return _decorator
+
+
 class NoShiftBase(Kernel):
     def get_scale_args(self, clip: vs.VideoNode, *args: Any, **kwargs: Any) -> dict[str, Any]:
         return super().get_scale_args(clip, (0, 0), *(args and args[1:]), **kwargs)
@@ -52,10 +96,13 @@ class NoShift(Bicubic, NoShiftBase):  # type: ignore
         return cls.from_kernel(kernel)
 
     @staticmethod
-    def from_kernel(kernel: KernelT) -> type[Kernel]:
+    @kernel_wrapper('NoShift')
+    def from_kernel(kernel_t: type[Kernel]) -> type[Kernel]:
         """
         Function or decorator for making a kernel not shift.
 
+        The class is created once per kernel, following calls return the same one.
+
         As example, in vsaa:
         ```
         doubled_no_shift = Znedi3(..., shifter=NoShift.from_kernel('lanczos')).scale(...)
@@ -73,8 +120,6 @@ class NoShift(Bicubic, NoShiftBase):  # type: ignore
         ```
         """
 
-        kernel_t = Kernel.from_param(kernel)
-
         class inner_no_shift(NoShiftBase, kernel_t):  # type: ignore
             ...
 
@@ -100,9 +145,8 @@ class NoScale(NoScaleBase, Bicubic):  # type: ignore
         return cls.from_kernel(kernel)
 
     @staticmethod
-    def from_kernel(kernel: KernelT) -> type[Kernel]:
-        kernel_t = Kernel.from_param(kernel)
-
+    @kernel_wrapper('NoScale')
+    def from_kernel(kernel_t: type[Kernel]) -> type[Kernel]:
         class inner_no_scale(kernel_t, NoScaleBase):  # type: ignore
             ...
 
@@ -149,21 +193,16 @@ class LinearLight:
 
     out_fmt: vs.VideoFormat | None = None
 
+    luma_only: bool = False
+    """Approximate by only linearizing the luma of YUV clips, skipping the conversion to and from RGB."""
+
     _linear: ClassVar[vs.VideoNode]
 
     @dataclass
     class LinearLightProcessing(cachedproperty.baseclass):
         ll: LinearLight
 
-        @cachedproperty
-        def linear(self) -> vs.VideoNode:
-            wclip: vs.VideoNode = self.ll._wclip
-
-            if self.ll._wclip.format.color_family is vs.YUV:
-                wclip = self.ll._resampler.resample(wclip, vs.RGBS, None, self.ll._matrix)
-            else:
-                wclip = depth(wclip, 32)
-
+        def _to_linear(self, wclip: vs.VideoNode) -> vs.VideoNode:
             if self.ll.linear:
                 wclip = Point.scale_function(wclip, transfer_in=self.ll._curve, transfer=Transfer.LINEAR)
 
@@ -181,6 +220,34 @@ class LinearLight:
 
             return wclip
 
+        def _from_linear(self, processed: vs.VideoNode) -> vs.VideoNode:
+            if self.ll.sigmoid:
+                processed = processed.std.Expr(
+                    f'1 1 {self.ll._sslope} {self.ll._scenter} x 0 max 1 min - * exp + /'
+                    f' {self.ll._soffset} - {self.ll._sscale} /'
+                )
+
+            if self.ll.linear:
+                processed = Point.scale_function(processed, transfer_in=Transfer.LINEAR, transfer=self.ll._curve)
+
+            return processed
+
+        @cachedproperty
+        def linear(self) -> vs.VideoNode:
+            wclip: vs.VideoNode = self.ll._wclip
+
+            if self.ll._luma_only:
+                wclip = depth(wclip, 32)
+
+                return core.std.ShufflePlanes([self._to_linear(get_y(wclip)), wclip], [0, 1, 2], vs.YUV)
+
+            if self.ll._wclip.format.color_family is vs.YUV:
+                wclip = self.ll._resampler.resample(wclip, vs.RGBS, None, self.ll._matrix)
+            else:
+                wclip = depth(wclip, 32)
+
+            return self._to_linear(wclip)
+
         @linear.setter  # type: ignore
         def linear(self, processed: vs.VideoNode) -> None:
             if self.ll._exited:
@@ -197,14 +264,12 @@ class LinearLight:
 
             processed = self._linear  # type: ignore
 
-            if self.ll.sigmoid:
-                processed = processed.std.Expr(
-                    f'1 1 {self.ll._sslope} {self.ll._scenter} x 0 max 1 min - * exp + /'
-                    f' {self.ll._soffset} - {self.ll._sscale} /'
+            if self.ll._luma_only and processed.format.color_family is vs.YUV:
+                processed = core.std.ShufflePlanes(
+                    [self._from_linear(get_y(processed)), processed], [0, 1, 2], vs.YUV
                 )
-
-            if self.ll.linear:
-                processed = Point.scale_function(processed, transfer_in=Transfer.LINEAR, transfer=self.ll._curve)
+            else:
+                processed = self._from_linear(processed)
 
             return resample_to(processed, self.ll._fmt, self.ll._matrix, self.ll._resampler)
 
@@ -234,6 +299,7 @@ class LinearLight:
         self._curve = Transfer.from_video(self.clip)
         self._matrix = Matrix.from_video(self.clip)
         self._resampler = Catrom.ensure_obj(self.resampler)
+        self._luma_only = self.luma_only and self._wclip.format.color_family is vs.YUV
 
         self._exited = False
 